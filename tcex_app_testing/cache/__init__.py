@@ -0,0 +1,10 @@
+"""TcEx Framework Module"""
+
+from .file_cache import FileCache
+from .file_lock import FileLock
+from .result_cache import ResultCache
+from .token_cache import TokenCache
+from .vault_cache import VaultCache
+
+# shared by EnvStore and StagerVault
+vault_cache = VaultCache()
@@ -0,0 +1,126 @@
+"""TcEx Framework Module"""
+
+# standard library
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Any
+
+from .file_lock import FileLock
+
+# get logger
+_logger = logging.getLogger(__name__.split('.', maxsplit=1)[0])
+
+
+class FileCache:
+    """JSON file cache with per entry expiration, shared by threads and xdist workers.
+
+    Cache files are stored in the pytest cache directory of the App
+    (e.g., .pytest_cache/d/tcex_app_testing/<name>.json).
+
+    Args:
+        name: The name of the cache, used as the filename.
+        ttl: The default time to live in seconds for new entries (None never expires).
+        cache_dir: Optional directory for the cache file.
+    """
+
+    def __init__(self, name: str, ttl: int | None = None, cache_dir: Path | None = None):
+        """Initialize instance properties."""
+        self.cache_dir = cache_dir or self.default_cache_dir()
+        self.name = name
+        self.ttl = ttl
+
+        # properties
+        self.filename = self.cache_dir / f'{name}.json'
+        self.lock = FileLock(self.cache_dir / f'{name}.lock')
+        self.log = _logger
+
+    @staticmethod
+    def default_cache_dir() -> Path:
+        """Return the directory for the tcex_app_testing pytest cache files."""
+        return Path.cwd() / '.pytest_cache' / 'd' / 'tcex_app_testing'
+
+    def _read(self) -> dict[str, dict]:
+        """Return all entries from the cache file."""
+        try:
+            with self.filename.open(encoding='utf-8') as fh:
+                return json.load(fh)
+        except (OSError, ValueError):
+            return {}
+
+    def _write(self, entries: dict[str, dict]):
+        """Write all entries to the cache file."""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+        # write to a temp file and replace, so readers never see a partial file
+        temp_filename = self.filename.with_name(f'{self.filename.name}.{os.getpid()}.tmp')
+        with temp_filename.open(mode='w', encoding='utf-8') as fh:
+            json.dump(entries, fh)
+        temp_filename.chmod(0o600)
+        temp_filename.replace(self.filename)
+
+    def clear(self):
+        """Remove all entries from the cache."""
+        with self.lock:
+            self._write({})
+
+    def delete(self, key: str):
+        """Delete an entry from the cache."""
+        with self.lock:
+            entries = self._read()
+            if entries.pop(key, None) is not None:
+                self._write(entries)
+
+    def get(self, key: str, default: Any = None, refresh: int = 0) -> Any:
+        """Return the value for the provided key.
+
+        Args:
+            key: The cache key.
+            default: The value returned when the key is missing or expired.
+            refresh: Treat entries that expire within this many seconds as expired.
+        """
+        entry = self.get_entry(key)
+        if entry is None:
+            return default
+
+        expires = entry.get('expires')
+        if expires is not None and expires - refresh <= time.time():
+            return default
+        return entry.get('value')
+
+    def get_entry(self, key: str) -> dict | None:
+        """Return the raw entry (value and expires) for the provided key."""
+        with self.lock:
+            return self._read().get(key)
+
+    def items(self) -> dict[str, Any]:
+        """Return all values that have not expired."""
+        now = time.time()
+        with self.lock:
+            return {
+                k: v.get('value')
+                for k, v in self._read().items()
+                if v.get('expires') is None or v['expires'] > now
+            }
+
+    def set(self, key: str, value: Any, ttl: int | None = None):
+        """Add or update an entry in the cache.
+
+        Args:
+            key: The cache key.
+            value: The JSON serializable value.
+            ttl: The time to live in seconds, defaults to the ttl of the cache.
+        """
+        ttl = ttl if ttl is not None else self.ttl
+        with self.lock:
+            entries = self._read()
+
+            # drop expired entries while the file is being rewritten
+            now = time.time()
+            entries = {
+                k: v for k, v in entries.items() if v.get('expires') is None or v['expires'] > now
+            }
+            entries[key] = {'expires': None if ttl is None else now + ttl, 'value': value}
+            self._write(entries)
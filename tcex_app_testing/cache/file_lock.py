@@ -0,0 +1,59 @@
+"""TcEx Framework Module"""
+
+# standard library
+import threading
+from pathlib import Path
+from typing import IO, Self
+
+try:
+    # standard library
+    import fcntl
+except ImportError:  # pragma: no cover
+    # fcntl is not available on windows, the lock is only thread safe
+    fcntl = None
+
+
+class FileLock:
+    """Reentrant lock that is safe across threads and processes (e.g., xdist workers).
+
+    Args:
+        filename: The lock file, created if it does not exist.
+    """
+
+    def __init__(self, filename: Path):
+        """Initialize instance properties."""
+        self.filename = filename
+
+        # properties
+        self._count = 0
+        self._fh: IO | None = None
+        self._lock = threading.RLock()
+
+    def __enter__(self) -> Self:
+        """Acquire the lock when entering the context."""
+        self.acquire()
+        return self
+
+    def __exit__(self, *args):
+        """Release the lock when exiting the context."""
+        self.release()
+
+    def acquire(self):
+        """Acquire the lock, blocking until it is available."""
+        self._lock.acquire()
+        if self._count == 0:
+            self.filename.parent.mkdir(parents=True, exist_ok=True)
+            self._fh = self.filename.open(mode='a', encoding='utf-8')
+            if fcntl is not None:
+                fcntl.flock(self._fh.fileno(), fcntl.LOCK_EX)
+        self._count += 1
+
+    def release(self):
+        """Release the lock."""
+        self._count -= 1
+        if self._count == 0 and self._fh is not None:
+            if fcntl is not None:
+                fcntl.flock(self._fh.fileno(), fcntl.LOCK_UN)
+            self._fh.close()
+            self._fh = None
+        self._lock.release()
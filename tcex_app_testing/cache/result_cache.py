@@ -0,0 +1,143 @@
+"""TcEx Framework Module"""
+
+# standard library
+import hashlib
+import logging
+import platform
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+# first-party
+from tcex_app_testing.__metadata__ import __version__
+from tcex_app_testing.pleb.cached_property import cached_property
+
+from .file_cache import FileCache
+
+# get logger
+_logger = logging.getLogger(__name__.split('.', maxsplit=1)[0])
+
+
+class ResultCache:
+    """Cache of the inputs of the last passing run of each profile.
+
+    A profile is considered unchanged when the hash of the profile, the App config files,
+    the App source, the feature test files and the test environments matches the hash of the
+    last passing run.
+
+    Args:
+        app_path: The path to the App.
+    """
+
+    # directories in the App path that are not part of the App source
+    excluded_dirs = frozenset(
+        [
+            '.git',
+            '.pytest_cache',
+            '.venv',
+            '__pycache__',
+            'deps',
+            'deps_tests',
+            'log',
+            'target',
+            'tests',
+            'venv',
+        ]
+    )
+
+    # App config and dependency files that change the behavior of the App
+    app_config_files = (
+        'app.yaml',
+        'install.json',
+        'layout.json',
+        'tcex.json',
+        'pyproject.toml',
+        'requirements.txt',
+        'requirements.lock',
+        'poetry.lock',
+        'uv.lock',
+    )
+
+    # the directories with the installed App and test dependencies
+    deps_dirs = ('deps', 'deps_tests')
+
+    def __init__(self, app_path: Path):
+        """Initialize instance properties."""
+        self.app_path = app_path
+
+        # properties
+        self.cache = FileCache('result_cache')
+        self.log = _logger
+
+    @staticmethod
+    def _hash_files(hasher: Any, base_path: Path, filenames: Iterable[Path]):
+        """Add the relative name and contents of each file to the hash."""
+        for filename in sorted(filenames):
+            if not filename.is_file():
+                continue
+            hasher.update(str(filename.relative_to(base_path)).encode())
+            hasher.update(b'\0')
+            hasher.update(filename.read_bytes())
+            hasher.update(b'\0')
+
+    def _app_source_files(self, path: Path) -> Iterable[Path]:
+        """Yield the App source files, skipping excluded directories."""
+        for item in path.iterdir():
+            if item.is_dir():
+                if item.name not in self.excluded_dirs and not item.name.startswith('.'):
+                    yield from self._app_source_files(item)
+            elif item.suffix == '.py':
+                yield item
+
+    @cached_property
+    def app_hash(self) -> str:
+        """Return the hash of the App source, config files and dependencies (once per session)."""
+        hasher = hashlib.sha256()
+        hasher.update(f'{__version__}|{platform.python_version()}'.encode())
+        self._hash_files(
+            hasher,
+            self.app_path,
+            [self.app_path / f for f in self.app_config_files],
+        )
+        self._hash_files(hasher, self.app_path, self._app_source_files(self.app_path))
+
+        # the name and version of the installed dependencies (e.g., tcex-4.0.5.dist-info)
+        for deps_dir in self.deps_dirs:
+            dist_infos = sorted(p.name for p in (self.app_path / deps_dir).glob('*.dist-info'))
+            hasher.update(f'{deps_dir}|{",".join(dist_infos)}'.encode())
+        return hasher.hexdigest()
+
+    def key(self, profile_filename: Path, environments: Iterable[str]) -> str:
+        """Return the hash of all inputs of the profile.
+
+        Args:
+            profile_filename: The profile filename (tests/<feature>/profiles.d/<profile>.json).
+            environments: The current test environments (e.g., TCEX_TEST_ENVS).
+        """
+        feature_dir = profile_filename.parent.parent
+        tests_dir = feature_dir.parent
+
+        hasher = hashlib.sha256()
+        hasher.update(self.app_hash.encode())
+        hasher.update(','.join(sorted(environments)).encode())
+
+        # the profile (including staged request fixtures)
+        self._hash_files(hasher, self.app_path, [profile_filename])
+
+        # the global test files (e.g., conftest.py, validate_custom.py) and feature test files
+        self._hash_files(hasher, self.app_path, tests_dir.glob('*.py'))
+        self._hash_files(hasher, self.app_path, feature_dir.glob('*.py'))
+        return hasher.hexdigest()
+
+    def delete(self, name: str):
+        """Remove the cached result of the profile."""
+        self.cache.delete(name)
+
+    def hit(self, name: str, key: str) -> bool:
+        """Return True if the profile passed in a previous run with the same inputs."""
+        return self.cache.get(name) == key
+
+    def record(self, name: str, key: str):
+        """Record a passing run of the profile."""
+        self.cache.set(name, key)
+        self.log.info(f'step=teardown-method, event=result-cache-record, profile={name}')
@@ -0,0 +1,93 @@
+"""TcEx Framework Module"""
+
+# standard library
+import hashlib
+import hmac
+import logging
+import time
+
+# first-party
+from tcex_app_testing.config_model import config_model
+from tcex_app_testing.pleb.cached_property import cached_property
+
+from .file_cache import FileCache
+from .vault_cache import VaultCache
+
+# get logger
+_logger = logging.getLogger(__name__.split('.', maxsplit=1)[0])
+
+
+class TokenCache(VaultCache):
+    """Encrypted on-disk cache of the TC API token, shared by pytest sessions and xdist workers.
+
+    The token is encrypted and authenticated the same way as the Vault cache, using keys
+    derived from the API secret key that is required to retrieve a token. Without a secret
+    key the token is only cached in memory. Entries expire when the token expires.
+    """
+
+    # tokens cached in memory (by entry key) when the disk cache is disabled
+    _memory: dict[str, dict] = {}  # noqa: RUF012
+
+    @cached_property
+    def cache(self) -> FileCache:
+        """Return the file cache for the encrypted tokens."""
+        return FileCache('tc_token', ttl=self.ttl)
+
+    @cached_property
+    def enabled(self) -> bool:
+        """Return True if the API secret key is set."""
+        return bool(self._secret_key)
+
+    @cached_property
+    def ttl(self) -> int:
+        """Return the number of seconds a token without a known expiration is considered valid."""
+        return config_model.test_token_ttl
+
+    @property
+    def _secret_key(self) -> str:
+        """Return the API secret key."""
+        secret_key = config_model.tc_api_secret_key
+        return str(getattr(secret_key, 'value', secret_key) or '')
+
+    def _derive_key(self, purpose: str) -> bytes:
+        """Return a key for the provided purpose derived from the API secret key."""
+        return hashlib.sha256(f'tcex-token-cache|{purpose}|{self._secret_key}'.encode()).digest()
+
+    @property
+    def _token_key(self) -> str:
+        """Return the cache key for the current API path and credentials."""
+        message = f'{config_model.tc_api_path}|{config_model.tc_api_access_id}'.encode()
+        return hmac.new(self._mac_key, message, hashlib.sha256).hexdigest()
+
+    def get_token(self, refresh: int = 0) -> dict | None:
+        """Return the cached token and expiration or None if no valid token is cached.
+
+        Args:
+            refresh: Treat tokens that expire within this many seconds as expired.
+        """
+        if not self.enabled:
+            data = self._memory.get(self._token_key)
+        else:
+            token = self.cache.get(self._token_key)
+            data = None if token is None else self.decrypt(token)
+            if token is not None and data is None:
+                self.log.warning('step=setup, event=token-cache-invalid-entry')
+
+        if data is None or data['expires'] - refresh <= time.time():
+            return None
+        return data
+
+    def set_token(self, token: str, expires: int):
+        """Add the token to the cache.
+
+        Args:
+            token: The API token.
+            expires: The expiration of the token (epoch seconds).
+        """
+        data = {'expires': expires, 'token': token}
+        if not self.enabled:
+            self._memory[self._token_key] = data
+            return
+
+        ttl = max(int(expires - time.time()), 0)
+        self.cache.set(self._token_key, self.encrypt(data), ttl=ttl)
@@ -0,0 +1,130 @@
+"""TcEx Framework Module"""
+
+# standard library
+import base64
+import hashlib
+import hmac
+import json
+import logging
+import os
+
+# third-party
+import pyaes
+
+# first-party
+from tcex_app_testing.pleb.cached_property import cached_property
+
+from .file_cache import FileCache
+
+# get logger
+_logger = logging.getLogger(__name__.split('.', maxsplit=1)[0])
+
+
+class VaultCache:
+    """Encrypted on-disk cache of Vault secrets, shared by pytest sessions and xdist workers.
+
+    The cache is opt-in and only enabled when the TCEX_TEST_VAULT_CACHE_KEY env variable
+    is set. Secrets are encrypted with AES-CBC using a key derived from that value and
+    authenticated with an HMAC, and expire after TCEX_TEST_VAULT_CACHE_TTL seconds
+    (default 3600). Cache keys are HMACs of the Vault address, mount point and path, so
+    the secret paths are not stored in plain text either.
+    """
+
+    def __init__(self):
+        """Initialize instance properties."""
+        self.log = _logger
+
+    @cached_property
+    def cache(self) -> FileCache:
+        """Return the file cache for the encrypted secrets."""
+        return FileCache('vault_secrets', ttl=self.ttl)
+
+    @cached_property
+    def enabled(self) -> bool:
+        """Return True if the cache key is set."""
+        return bool(os.getenv('TCEX_TEST_VAULT_CACHE_KEY'))
+
+    @cached_property
+    def _encryption_key(self) -> bytes:
+        """Return the AES-256 key derived from the cache key."""
+        return self._derive_key('encryption')
+
+    @cached_property
+    def _mac_key(self) -> bytes:
+        """Return the HMAC key derived from the cache key."""
+        return self._derive_key('mac')
+
+    @cached_property
+    def ttl(self) -> int:
+        """Return the number of seconds a cached secret is considered valid."""
+        return int(os.getenv('TCEX_TEST_VAULT_CACHE_TTL', '3600'))
+
+    def _derive_key(self, purpose: str) -> bytes:
+        """Return a key for the provided purpose derived from the cache key."""
+        key = os.getenv('TCEX_TEST_VAULT_CACHE_KEY', '')
+        return hashlib.sha256(f'tcex-vault-cache|{purpose}|{key}'.encode()).digest()
+
+    def _entry_key(self, mount_point: str, path: str) -> str:
+        """Return the cache key for the secret."""
+        vault_addr = os.getenv('VAULT_ADDR') or os.getenv('VAULT_URL') or ''
+        message = f'{vault_addr}|{mount_point}|{path}'.encode()
+        return hmac.new(self._mac_key, message, hashlib.sha256).hexdigest()
+
+    def decrypt(self, token: str) -> dict | None:
+        """Return the secret data or None if the token can not be authenticated."""
+        try:
+            raw = base64.b64decode(token)
+        except ValueError:
+            return None
+
+        iv, ciphertext, mac = raw[:16], raw[16:-32], raw[-32:]
+        expected_mac = hmac.new(self._mac_key, iv + ciphertext, hashlib.sha256).digest()
+        if not hmac.compare_digest(mac, expected_mac):
+            # the cache key changed or the file was modified
+            return None
+
+        decrypter = pyaes.Decrypter(pyaes.AESModeOfOperationCBC(self._encryption_key, iv))
+        plaintext = decrypter.feed(ciphertext) + decrypter.feed()
+        return json.loads(plaintext)
+
+    def encrypt(self, data: dict) -> str:
+        """Return the encrypted and authenticated secret data."""
+        iv = os.urandom(16)
+        encrypter = pyaes.Encrypter(pyaes.AESModeOfOperationCBC(self._encryption_key, iv))
+        ciphertext = encrypter.feed(json.dumps(data)) + encrypter.feed()
+        mac = hmac.new(self._mac_key, iv + ciphertext, hashlib.sha256).digest()
+        return base64.b64encode(iv + ciphertext + mac).decode()
+
+    def get(self, mount_point: str, path: str) -> dict | None:
+        """Return the cached secret data or None if the secret is not cached.
+
+        Args:
+            mount_point: The Vault mount point (e.g., myData).
+            path: The path of the secret (e.g., myResource).
+        """
+        if not self.enabled:
+            return None
+
+        token = self.cache.get(self._entry_key(mount_point, path))
+        if token is None:
+            return None
+
+        data = self.decrypt(token)
+        if data is None:
+            self.log.warning(
+                f'step=setup, event=vault-cache-invalid-entry, path={mount_point}/{path}'
+            )
+        else:
+            self.log.debug(f'step=setup, event=vault-cache-hit, path={mount_point}/{path}')
+        return data
+
+    def set(self, mount_point: str, path: str, data: dict):
+        """Add the secret data to the cache.
+
+        Args:
+            mount_point: The Vault mount point (e.g., myData).
+            path: The path of the secret (e.g., myResource).
+            data: The secret data.
+        """
+        if self.enabled and data:
+            self.cache.set(self._entry_key(mount_point, path), self.encrypt(data))
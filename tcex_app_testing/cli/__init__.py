@@ -1,6 +1,7 @@
 """TcEx Framework Module"""
 
 # first-party
+from tcex_app_testing.cli.bench import Bench
 from tcex_app_testing.cli.create import Create
 from tcex_app_testing.cli.negative import Negative
 from tcex_app_testing.cli.update import Update
@@ -0,0 +1,211 @@
+"""TcEx Framework Module"""
+
+# standard library
+import math
+import os
+import sys
+import time
+import tracemalloc
+from collections import Counter
+from collections.abc import Callable
+from pathlib import Path
+
+# third-party
+import pytest
+from _pytest.main import Session
+from _pytest.nodes import Item
+from _pytest.runner import runtestprotocol
+from redis import Redis
+
+# first-party
+from tcex_app_testing.cli.cli_abc import CliABC
+from tcex_app_testing.render.render import Render
+
+
+def current_rss() -> int:
+    """Return the current resident set size (in KB) of the process, or 0 if not available."""
+    try:
+        with Path('/proc/self/statm').open(encoding='utf-8') as fh:
+            resident_pages = int(fh.read().split()[1])
+    except (OSError, IndexError, ValueError):  # pragma: no cover (not linux)
+        return 0
+    return resident_pages * os.sysconf('SC_PAGE_SIZE') // 1024
+
+
+def max_rss() -> int:
+    """Return the peak resident set size (in KB) of the process and its children.
+
+    This is the high-water mark for the lifetime of the process, not of a single iteration.
+    """
+    try:
+        # standard library
+        import resource  # noqa: PLC0415
+    except ImportError:  # pragma: no cover (windows)
+        return 0
+
+    rss = max(
+        resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss,
+    )
+    if sys.platform == 'darwin':
+        # macOS reports bytes instead of KB
+        rss //= 1024
+    return rss
+
+
+def percentile(values: list[float], percent: float) -> float:
+    """Return the percentile of the values using the nearest-rank method."""
+    if not values:
+        return 0.0
+    values = sorted(values)
+    rank = max(math.ceil(percent / 100 * len(values)), 1)
+    return values[rank - 1]
+
+
+class BenchPlugin:
+    """Pytest plugin that runs the selected test item repeatedly and records metrics.
+
+    Args:
+        iterations: The number of measured runs.
+        warmup: The number of runs before the measured runs (not recorded).
+    """
+
+    def __init__(self, iterations: int, warmup: int):
+        """Initialize instance properties."""
+        self.iterations = iterations
+        self.warmup = warmup
+
+        # properties
+        self.peak_rss = 0
+        self.redis_commands: Counter = Counter()
+        self.results: list[dict] = []
+
+    def _patch_redis(self) -> Callable:
+        """Count the Redis commands issued in the test process and return the original method."""
+        execute_command = Redis.execute_command
+        redis_commands = self.redis_commands
+
+        def _execute_command(self, *args, **options):
+            redis_commands[str(args[0]).upper()] += 1
+            return execute_command(self, *args, **options)
+
+        Redis.execute_command = _execute_command  # type: ignore
+        return execute_command
+
+    def pytest_collection_modifyitems(self, session: Session, items: list[Item]):  # noqa: ARG002
+        """Ensure that only a single test case is benchmarked."""
+        if len(items) != 1:
+            ex_msg = f'The bench command requires exactly one test case, found {len(items)}.'
+            raise RuntimeError(ex_msg)
+
+    def pytest_runtest_protocol(self, item: Item, nextitem: Item | None) -> bool:
+        """Run the test item for warmup and measured iterations."""
+        total = self.warmup + self.iterations
+
+        execute_command = self._patch_redis()
+        tracemalloc.start()
+        try:
+            for iteration in range(total):
+                last = iteration == total - 1
+                self.redis_commands.clear()
+                tracemalloc.reset_peak()
+
+                rss_start = current_rss()
+                start = time.perf_counter()
+                reports = runtestprotocol(
+                    item,
+                    # keep class setup between iterations, teardown after the last iteration
+                    nextitem=nextitem if last else item,
+                    log=last,
+                )
+                elapsed = time.perf_counter() - start
+                rss_delta = current_rss() - rss_start
+
+                if iteration < self.warmup:
+                    continue
+
+                self.results.append(
+                    {
+                        'elapsed': elapsed,
+                        'outcome': 'failed' if any(r.failed for r in reports) else 'passed',
+                        'redis_commands': sum(self.redis_commands.values()),
+                        'redis_command_counts': dict(self.redis_commands),
+                        'rss_delta': rss_delta,
+                        'tracemalloc_peak': tracemalloc.get_traced_memory()[1],
+                    }
+                )
+        finally:
+            tracemalloc.stop()
+            Redis.execute_command = execute_command  # type: ignore
+            self.peak_rss = max_rss()
+        return True
+
+
+class Bench(CliABC):
+    """CLI Bench Class"""
+
+    def __init__(self, feature: str, profile_name: str, iterations: int, warmup: int):
+        """Initialize instance properties."""
+        super().__init__()
+        self.feature = feature
+        self.iterations = iterations
+        self.profile_name = profile_name
+        self.warmup = warmup
+
+        # properties
+        self.plugin = BenchPlugin(iterations, warmup)
+
+    @property
+    def node_id(self) -> str:
+        """Return the pytest node id for the profile."""
+        return (
+            f'tests/{self.feature}/test_profiles.py::TestProfiles::'
+            f'test_profiles[{self.profile_name}]'
+        )
+
+    @property
+    def profile_filename(self) -> Path:
+        """Return the profile filename."""
+        return Path('tests') / self.feature / 'profiles.d' / f'{self.profile_name}.json'
+
+    def run(self) -> int:
+        """Run the profile and return the pytest exit code."""
+        if not self.profile_filename.is_file():
+            Render.panel.failure(f'Profile {self.profile_filename} could not be found.')
+
+        self.log.info(
+            f'event=bench, feature={self.feature}, profile={self.profile_name}, '
+            f'iterations={self.iterations}, warmup={self.warmup}'
+        )
+        # run in this process (no xdist) so that every iteration is measured the same way
+        return pytest.main([self.node_id, '-q', '-p', 'no:xdist'], plugins=[self.plugin])
+
+    @property
+    def summary(self) -> dict[str, str]:
+        """Return the summary of the measured iterations."""
+        elapsed = [r['elapsed'] for r in self.plugin.results]
+        redis_counts: Counter = Counter()
+        for result in self.plugin.results:
+            redis_counts.update(result['redis_command_counts'])
+
+        iterations = max(len(self.plugin.results), 1)
+        return {
+            'Iterations': str(len(self.plugin.results)),
+            'Failed': str(sum(r['outcome'] == 'failed' for r in self.plugin.results)),
+            'p50': f'{percentile(elapsed, 50):.3f}s',
+            'p95': f'{percentile(elapsed, 95):.3f}s',
+            'p99': f'{percentile(elapsed, 99):.3f}s',
+            'Min/Max': f'{min(elapsed, default=0):.3f}s / {max(elapsed, default=0):.3f}s',
+            'RSS Delta (max)': (
+                f'{max((r["rss_delta"] for r in self.plugin.results), default=0) / 1024:+.1f} MB'
+            ),
+            'Process Peak RSS': f'{self.plugin.peak_rss / 1024:.1f} MB',
+            'Peak Traced': (
+                f'{max((r["tracemalloc_peak"] for r in self.plugin.results), default=0) / 1024:.1f}'
+                ' KB'
+            ),
+            'Redis Commands': ', '.join(
+                f'{k}={v / iterations:.1f}' for k, v in redis_counts.most_common()
+            )
+            or 'N/A',
+        }
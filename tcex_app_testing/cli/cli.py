@@ -8,7 +8,7 @@ from pathlib import Path
 import typer
 
 # first-party
-from tcex_app_testing.cli import Create, Negative, Update
+from tcex_app_testing.cli import Bench, Create, Negative, Update
 from tcex_app_testing.config_model import config_model
 from tcex_app_testing.render.render import Render
 
@@ -19,6 +19,33 @@ app = typer.Typer()
 _logger = logging.getLogger(__name__.split('.', maxsplit=1)[0])
 
 
+@app.command()
+def bench(
+    feature: str = typer.Option(..., help='The testing feature name (e.g., RetrieveAlerts).'),
+    profile_name: str = typer.Option(..., help='The name of the testing profile to benchmark.'),
+    iterations: int = typer.Option(default=10, help='The number of measured runs.'),
+    warmup: int = typer.Option(
+        default=1, help='The number of runs before measuring (e.g., to import the App).'
+    ),
+):
+    """Run a test profile repeatedly and report timing, memory and Redis usage.
+
+    Redis commands are counted in the test process, which includes the App only when
+    the run_method is "inline".
+    """
+    try:
+        tcb = Bench(feature, profile_name, iterations, warmup)
+        exit_code = tcb.run()
+
+        # render results table
+        Render.table_bench(tcb.plugin.results, tcb.summary, f'Bench {feature}/{profile_name}')
+        if exit_code != 0:
+            Render.panel.failure(f'Bench run finished with pytest exit code {exit_code}.')
+    except Exception as ex:
+        _logger.exception('Error running the bench command.')
+        Render.panel.failure(f'{type(ex).__name__}: {ex}')
+
+
 @app.command()
 def create(
     feature: str = typer.Option(
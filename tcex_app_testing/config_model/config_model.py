@@ -389,31 +389,63 @@ class ConfigModel(BaseModel):
     @property
     def test_case_tc_in_path(self) -> Path:
         """Return profile fully qualified filename."""
-        fqfn = self.app_path / self.tc_in_path / self.test_case_feature
-        if ij.model.runtime_level.lower() not in self.runtime_level_service_apps:
-            fqfn = fqfn / self.test_case_name
-        return fqfn
+        return self._test_case_path(self.tc_in_path)
 
     @property
     def test_case_tc_log_path(self) -> Path:
         """Return profile fully qualified filename."""
-        fqfn = self.app_path / self.tc_log_path / self.test_case_feature
-        if ij.model.runtime_level.lower() not in self.runtime_level_service_apps:
-            fqfn = fqfn / self.test_case_name
-        return fqfn
+        return self._test_case_path(self.tc_log_path)
 
     @property
     def test_case_tc_out_path(self) -> Path:
         """Return profile fully qualified filename."""
-        fqfn = self.app_path / self.tc_out_path / self.test_case_feature
-        if ij.model.runtime_level.lower() not in self.runtime_level_service_apps:
-            fqfn = fqfn / self.test_case_name
-        return fqfn
+        return self._test_case_path(self.tc_out_path)
 
     @property
     def test_case_tc_temp_path(self) -> Path:
         """Return profile fully qualified filename."""
-        fqfn = self.app_path / self.tc_temp_path / self.test_case_feature
+        return self._test_case_path(self.tc_temp_path)
+
+    @property
+    def test_context_ttl(self) -> int:
+        """Return the number of seconds a kv store context is kept in redis."""
+        return int(os.getenv('TCEX_TEST_CONTEXT_TTL', '3600'))
+
+    @property
+    def test_fields_ttl(self) -> int:
+        """Return the number of seconds cached ThreatConnect v3 field metadata is valid."""
+        return int(os.getenv('TCEX_TEST_FIELDS_TTL', '86400'))
+
+    @property
+    def test_tc_batch(self) -> bool:
+        """Return True if staged ThreatConnect indicators should be created with the batch API."""
+        return os.getenv('TCEX_TEST_TC_BATCH', 'false').lower() == 'true'
+
+    @property
+    def test_tc_reuse(self) -> bool:
+        """Return True if identical staged ThreatConnect objects are shared by profiles."""
+        return os.getenv('TCEX_TEST_TC_REUSE', 'false').lower() == 'true'
+
+    @property
+    def test_token_ttl(self) -> int:
+        """Return the number of seconds a cached API token is considered valid."""
+        return int(os.getenv('TCEX_TEST_TOKEN_TTL', '3600'))
+
+    @property
+    def test_worker_id(self) -> str | None:
+        """Return the pytest-xdist worker id (e.g., gw0) when running tests in parallel."""
+        return os.getenv('PYTEST_XDIST_WORKER')
+
+    def _test_case_path(self, path: str) -> Path:
+        """Return the fully qualified in/log/out/temp path for the current test case.
+
+        When running in parallel each xdist worker gets its own directory so that
+        service Apps (which share a directory per feature) do not collide.
+        """
+        fqfn = self.app_path / path
+        if self.test_worker_id is not None:
+            fqfn = fqfn / self.test_worker_id
+        fqfn = fqfn / self.test_case_feature
         if ij.model.runtime_level.lower() not in self.runtime_level_service_apps:
             fqfn = fqfn / self.test_case_name
         return fqfn
@@ -3,12 +3,16 @@
 # standard library
 import logging
 import os
+import threading
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 
 # third-party
 import hvac
 from hvac.exceptions import InvalidPath, VaultError
 
 # first-party
+from tcex_app_testing.cache import vault_cache
 from tcex_app_testing.pleb.cached_property import cached_property
 from tcex_app_testing.pleb.singleton import Singleton
 from tcex_app_testing.render.render import Render
@@ -20,12 +24,18 @@ _logger = logging.getLogger(__name__.split('.', maxsplit=1)[0])
 class EnvStore(metaclass=Singleton):
     """TcEx Key Value API Module."""
 
+    # the max number of concurrent Vault reads in getenv_many
+    max_workers = 8
+
     def __init__(self):
         """Initialize the Class properties."""
 
         # properties
         self.cache = {}
         self.log = _logger
+        self.secret_cache: dict[tuple[str, str], dict] = {}
+        self._secret_lock = threading.Lock()
+        self._secret_requests: dict[tuple[str, str], threading.Event] = {}
         self.tcex_test_vault_base_path = os.getenv('TCEX_TEST_VAULT_BASE_PATH', '').rstrip('/')
         self.vault_token = os.getenv('VAULT_TOKEN')
         self.vault_addr = os.getenv('VAULT_ADDR') or os.getenv('VAULT_URL')
@@ -69,6 +79,45 @@ class EnvStore(metaclass=Singleton):
         """Return True if the env variable is a path variable."""
         return env_variable.startswith('/')
 
+    def _normalize_env_variable(self, env_variable: str) -> str:
+        """Return the env variable with the vault base path prepended for path variables."""
+        # only prepend if current path doesn't already start with this value
+        if not self._has_base_path(env_variable) and self._is_path_variable(env_variable):
+            env_variable = f'{self.tcex_test_vault_base_path}{env_variable}'
+        return env_variable
+
+    @staticmethod
+    def _secret_path(full_path: str) -> tuple[str, str, str]:
+        """Return the mount point, secret path and key for a vault path.
+
+        (e.g., "/myData/myResource/token" -> ("myData", "myResource", "token"))
+        """
+        paths = full_path.lstrip('/').split('/')
+
+        # the key stored in data object at the provided path
+        # (e.g., "/myData/myResource/token" -> "token")
+        key = paths[-1].strip('/')
+
+        # the path with the key and mount point removed
+        # (e.g., "/myData/myResource/token/" -> "myResource")
+        path = '/'.join(paths[1:-1])
+
+        # the mount point from the path
+        # (e.g., "/myData/myResource/token/" -> "myData")
+        mount_point = paths[0]
+
+        return mount_point, path, key
+
+    def _vault_required(self, env_variable: str, env_type: str | None) -> bool:
+        """Return True if getenv would read the (normalized) env variable from Vault."""
+        if f'{env_type}-{env_variable}' in self.cache:
+            return False
+
+        env_value = os.getenv(self._convert_env(env_variable))
+        if env_type in ['env', 'envs', 'local'] and env_value is not None:
+            return False
+        return env_type in ['env', 'envs', 'remote', 'vault'] and self.vault_client is not None
+
     def getenv(
         self, env_variable: str, env_type: str | None = 'env', default: str | None = None
     ) -> str:
@@ -79,14 +128,13 @@ class EnvStore(metaclass=Singleton):
             env_type: The type of environment variable to look up. Defaults to 'env'.
             default: The default value if no value is found.
         """
-        # only prepend if current path doesn't already start with this value
-        if not self._has_base_path(env_variable) and self._is_path_variable(env_variable):
-            env_variable = f'{self.tcex_test_vault_base_path}{env_variable}'
+        env_variable = self._normalize_env_variable(env_variable)
 
+        # values that could not be resolved are cached as None (negative cache)
         cache_key = f'{env_type}-{env_variable}'
-        cache_value = self.cache.get(cache_key)
-        if cache_value is not None:
-            return cache_value
+        if cache_key in self.cache:
+            value = self.cache[cache_key]
+            return (default or '') if value is None else value
 
         # only log when not retrieving from cache
         self.log.info(
@@ -95,7 +143,8 @@ class EnvStore(metaclass=Singleton):
 
         # convert path (e.g. /threatconnect/tc/tc_api_access_id) to env variable [TC_API_ACCESS_ID]
         env_var_updated = self._convert_env(env_variable)
-        value = default
+        value = None
+        cacheable = True
 
         env_value = os.getenv(env_var_updated)
         if env_type in ['env', 'envs', 'local'] and env_value is not None:
@@ -103,19 +152,61 @@ class EnvStore(metaclass=Singleton):
             value = env_value
         elif env_type in ['env', 'envs', 'remote', 'vault'] and self.vault_client is not None:
             # return value from Vault
-            value = self.read_from_vault(env_variable, default)
+            mount_point, path, key = self._secret_path(env_variable)
+            value = self.read_secret(mount_point, path).get(key) or None
+
+            # failed reads (e.g., a VaultError) are not cached by read_secret and are retried
+            cacheable = (mount_point, path) in self.secret_cache
 
         # provide an error so dev/qa engineer knows that
         # an env var they provide could not be found
-        if value is None:
+        if value is None and default is None:
             Render.panel.error(
                 f'Could not resolve env variable {env_variable} ({env_var_updated}).'
             )
 
-        # update cache
-        if env_type not in ['local']:
+        # update cache (the default is not cached, it is applied on each lookup)
+        if env_type not in ['local'] and cacheable:
             self.cache[cache_key] = value
-        return value or ''
+        return (default or '') if value is None else value
+
+    def getenv_many(
+        self, env_variables: Iterable[tuple[str, str | None, str | None]]
+    ) -> dict[tuple[str, str | None, str | None], str]:
+        """Return the values for multiple environment variables.
+
+        Resolution happens in two phases. First the Vault secrets required by all variables
+        that are not cached are read concurrently, once per secret path. Then each variable is
+        resolved with getenv from the secret cache.
+
+        Args:
+            env_variables: The (env_variable, env_type, default) of each variable.
+        """
+        env_variables = list(dict.fromkeys(env_variables))
+
+        # phase 1: read the distinct secrets that are required for cache misses
+        self.read_secrets(self.secret_paths(env_variables))
+
+        # phase 2: resolve all variables
+        return {v: self.getenv(*v) for v in env_variables}
+
+    def secret_paths(
+        self, env_variables: Iterable[tuple[str, str | None, str | None]]
+    ) -> list[tuple[str, str]]:
+        """Return the distinct (mount_point, path) of the secrets required by the variables.
+
+        Args:
+            env_variables: The (env_variable, env_type, default) of each variable.
+        """
+        return list(
+            dict.fromkeys(
+                self._secret_path(env_variable)[:2]
+                for env_variable, env_type in (
+                    (self._normalize_env_variable(v), t) for v, t, _ in env_variables
+                )
+                if self._vault_required(env_variable, env_type)
+            )
+        )
 
     def read_from_vault(self, full_path: str, default: str | None = None) -> str | None:
         """Read data from Vault for the provided path.
@@ -127,39 +218,104 @@ class EnvStore(metaclass=Singleton):
         if self.vault_client is None:
             return None
 
-        # self.log.debug(f'step=config, event=read-from-vault, full-path={full_path}')
-        paths = full_path.lstrip('/').split('/')
+        mount_point, path, key = self._secret_path(full_path)
+        return self.read_secret(mount_point, path).get(key) or default
 
-        # the key stored in data object at the provided path
-        # (e.g., "/myData/myResource/token" -> "token")
-        key = paths[-1].strip('/')
+    def read_secret(self, mount_point: str, path: str, render: bool = True) -> dict:
+        """Return the data of the secret at the provided mount point and path.
 
-        # the path with the key and mount point removed
-        # (e.g., "/myData/myResource/token/" -> "myResource")
-        path = '/'.join(paths[1:-1])
+        The whole secret is cached, so reading multiple keys of a secret makes a single
+        Vault request. Concurrent reads of the same secret wait for the first request
+        instead of making their own (single-flight). When the Vault cache is enabled,
+        secrets are also read from and written to the encrypted on-disk cache.
 
-        # the mount point from the path
-        # (e.g., "/myData/myResource/token/" -> "myData")
-        mount_point = paths[0]
+        Args:
+            mount_point: The Vault mount point (e.g., myData).
+            path: The path of the secret (e.g., myResource).
+            render: If False, errors are only logged (e.g., when prefetching secrets).
+        """
+        if self.vault_client is None:
+            return {}
+
+        secret_key = (mount_point, path)
+        with self._secret_lock:
+            if secret_key in self.secret_cache:
+                return self.secret_cache[secret_key]
+
+            request = self._secret_requests.get(secret_key)
+            leader = request is None
+            if leader:
+                request = self._secret_requests[secret_key] = threading.Event()
+
+        if not leader:
+            # another thread is reading the secret, wait for the result
+            request.wait()  # type: ignore
+            return self.secret_cache.get(secret_key, {})
 
-        data = {}
         try:
-            data = self.vault_client.secrets.kv.read_secret_version(
+            data = vault_cache.get(mount_point, path)
+            cacheable = data is not None
+            if data is None:
+                data, cacheable = self._read_secret(mount_point, path, render)
+                vault_cache.set(mount_point, path, data)
+            if cacheable:
+                with self._secret_lock:
+                    self.secret_cache[secret_key] = data
+        finally:
+            with self._secret_lock:
+                del self._secret_requests[secret_key]
+            request.set()  # type: ignore
+        return data
+
+    def read_secrets(self, secret_paths: Iterable[tuple[str, str]], render: bool = True):
+        """Read multiple secrets concurrently into the secret cache.
+
+        Args:
+            secret_paths: The (mount_point, path) of each secret.
+            render: If False, errors are only logged (e.g., when prefetching secrets).
+        """
+        secret_paths = [p for p in dict.fromkeys(secret_paths) if p not in self.secret_cache]
+        if not secret_paths or self.vault_client is None:
+            return
+
+        self.log.info(f'step=config, event=read-secrets, secret-count={len(secret_paths)}')
+        with ThreadPoolExecutor(
+            max_workers=min(self.max_workers, len(secret_paths)),
+            thread_name_prefix='env-store',
+        ) as executor:
+            list(executor.map(lambda p: self.read_secret(*p, render=render), secret_paths))
+
+    def _read_secret(self, mount_point: str, path: str, render: bool) -> tuple[dict, bool]:
+        """Read the secret from Vault and return the data and whether the result is cacheable.
+
+        Missing paths are cacheable (negative cache), other errors are retried on the next read.
+        """
+        self.log.debug(f'step=config, event=read-secret, path={mount_point}/{path}')
+        try:
+            data = self.vault_client.secrets.kv.read_secret_version(  # type: ignore
                 path=path, mount_point=mount_point
             )
         except InvalidPath:
             self.log.exception(f'step=setup, event=env-store-invalid-path, path={path}')
-            Render.panel.warning(f'Error reading from Vault for path {path}. Path was not found.')
+            if render:
+                Render.panel.warning(
+                    f'Error reading from Vault for path {path}. Path was not found.'
+                )
+            return {}, True
         except VaultError:
             self.log.exception(f'step=setup, event=env-store-error-reading-path, path={path}')
-            Render.panel.warning(
-                f'Error reading from Vault for path {path}. Check access and credentials.'
-            )
+            if render:
+                Render.panel.warning(
+                    f'Error reading from Vault for path {path}. Check access and credentials.'
+                )
+            return {}, False
         except Exception:
             self.log.exception('step=setup, event=env-store-generic-failure')
-            Render.panel.warning(f'Error reading from Vault for path {path}.')
+            if render:
+                Render.panel.warning(f'Error reading from Vault for path {path}.')
+            return {}, False
 
-        return data.get('data', {}).get('data', {}).get(key) or default
+        return (data or {}).get('data', {}).get('data', {}) or {}, True
 
     @cached_property
     def vault_client(self) -> hvac.Client | None:
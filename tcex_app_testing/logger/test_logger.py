@@ -2,6 +2,7 @@
 
 # standard library
 import logging
+import os
 from pathlib import Path
 
 from .rotating_file_handler_custom import RotatingFileHandlerCustom
@@ -16,8 +17,11 @@ class TestLogger(TraceLogger):
         # set logger level to TRACE
         self.setLevel(5)
 
-        # set the appropriate log file name (must be tests.log)
+        # set the appropriate log file name (must be tests.log or tests-<worker>.log for xdist)
         filename = Path.cwd() / 'log' / 'tests.log'
+        worker_id = os.getenv('PYTEST_XDIST_WORKER')
+        if worker_id is not None:
+            filename = filename.with_name(f'tests-{worker_id}.log')
 
         # clear previous logfile
         if filename.exists():
@@ -0,0 +1,9 @@
+"""TcEx Framework Module"""
+
+__all__ = ['LeakCheck', 'PhaseTimer', 'phase_timer']
+
+# first-party
+from tcex_app_testing.metrics.leak_check import LeakCheck
+from tcex_app_testing.metrics.phase_timer import PhaseTimer
+
+phase_timer = PhaseTimer()
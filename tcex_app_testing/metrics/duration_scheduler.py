@@ -0,0 +1,132 @@
+"""TcEx Framework Module"""
+
+# standard library
+import heapq
+import logging
+import os
+import re
+
+# third-party
+import pytest
+from _pytest.config import Config
+from _pytest.nodes import Item
+from _pytest.reports import TestReport
+
+# get logger
+_logger = logging.getLogger(__name__.split('.', maxsplit=1)[0])
+
+
+class DurationScheduler:
+    """Pytest plugin that orders tests by their duration in previous runs (longest first).
+
+    Durations are recorded by the pytest controller process (which receives the reports
+    of all xdist workers) and stored in the pytest cache. When scheduling is enabled the
+    longest tests are started first, so that slow tests do not end up last on a single
+    worker. With "--dist loadgroup" the tests are also assigned to one xdist_group per
+    worker using the LPT (longest processing time) algorithm.
+
+    Tests are only reordered in xdist workers. Without xdist the order is kept, so that class
+    setup (e.g., launching a service App) runs once per feature.
+
+    Args:
+        config: The pytest config object.
+        enabled: If True, the tests are ordered by duration (durations are always recorded).
+    """
+
+    cache_key = 'tcex_app_testing/durations'
+    group_prefix = 'tcex-lpt-'
+
+    def __init__(self, config: Config, enabled: bool = False):
+        """Initialize instance properties."""
+        self.config = config
+        self.enabled = enabled
+
+        # properties
+        self.durations: dict[str, float] = {}
+        self.log = _logger
+
+    @property
+    def previous_durations(self) -> dict[str, float]:
+        """Return the test durations from previous runs."""
+        if getattr(self.config, 'cache', None) is None:
+            return {}
+        return self.config.cache.get(self.cache_key, {})  # type: ignore
+
+    @property
+    def loadgroup(self) -> bool:
+        """Return True if xdist distributes tests with --dist loadgroup."""
+        return (
+            getattr(self.config.option, 'dist', None) == 'loadgroup'
+            or getattr(self.config.option, 'loadgroup', False) is True
+        )
+
+    @property
+    def workers(self) -> int:
+        """Return the number of xdist workers."""
+        return int(os.getenv('PYTEST_XDIST_WORKER_COUNT', '1'))
+
+    def nodeid(self, nodeid: str) -> str:
+        """Return the node id without the xdist_group suffix added by this scheduler."""
+        return re.sub(rf'@{self.group_prefix}\d+$', '', nodeid)
+
+    @property
+    def controller(self) -> bool:
+        """Return True if this is the controller (or only) pytest process."""
+        return os.getenv('PYTEST_XDIST_WORKER') is None
+
+    def order(self, items: list[Item]):
+        """Sort the items longest first (in place) and assign xdist groups for loadgroup."""
+        durations = self.previous_durations
+        if not durations or self.controller:
+            return
+
+        # tests without a previous duration (e.g., new profiles) are treated as the slowest
+        default = max(durations.values())
+        item_durations = {item.nodeid: durations.get(item.nodeid, default) for item in items}
+
+        # the sort is stable, so the order is deterministic for all xdist workers
+        items.sort(key=lambda item: item_durations[item.nodeid], reverse=True)
+        self.log.info(f'event=schedule-by-duration, items={len(items)}')
+
+        if not self.loadgroup or self.workers <= 1:
+            return
+
+        # assign each test to the least loaded worker group (LPT)
+        groups = [(0.0, i) for i in range(self.workers)]
+        for item in items:
+            if item.get_closest_marker('xdist_group') is not None:
+                # respect groups defined by the App developer
+                continue
+            load, group = heapq.heappop(groups)
+            item.add_marker(pytest.mark.xdist_group(f'{self.group_prefix}{group}'))
+            heapq.heappush(groups, (load + item_durations[item.nodeid], group))
+
+    def record(self, report: TestReport):
+        """Add the duration of the setup/call/teardown phase of a test."""
+        nodeid = self.nodeid(report.nodeid)
+        self.durations[nodeid] = self.durations.get(nodeid, 0.0) + report.duration
+
+    def save(self):
+        """Merge the recorded durations with the previous durations and save to the cache."""
+        if not self.durations or getattr(self.config, 'cache', None) is None:
+            return
+
+        durations = self.previous_durations
+        durations.update({k: round(v, 3) for k, v in self.durations.items()})
+        self.config.cache.set(self.cache_key, durations)  # type: ignore
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_collection_modifyitems(self, items: list[Item]):
+        """Order the collected tests (before xdist adds the group to the node id)."""
+        if self.enabled:
+            self.order(items)
+
+    def pytest_runtest_logreport(self, report: TestReport):
+        """Record the duration of each test phase (the controller receives all reports)."""
+        if self.controller:
+            self.record(report)
+
+    def pytest_sessionfinish(self):
+        """Save the test durations."""
+        if self.controller:
+            self.save()
@@ -0,0 +1,190 @@
+"""TcEx Framework Module"""
+
+# standard library
+import gc
+import json
+import logging
+import os
+import tracemalloc
+from collections import Counter
+from pathlib import Path
+
+# get logger
+_logger = logging.getLogger(__name__.split('.', maxsplit=1)[0])
+
+
+class LeakCheck:
+    """Detect memory that is retained between profiles (e.g., run_method="inline").
+
+    A tracemalloc snapshot and a count of live objects by type are taken before and after
+    each test. The growth is logged and one JSON record per test is appended to
+    log/leak_check.jsonl (leak_check-<worker>.jsonl when running with pytest-xdist).
+
+    Args:
+        frames: The number of frames tracemalloc stores for each allocation.
+        limit: The number of allocation sites and object types reported per test.
+    """
+
+    def __init__(self, frames: int = 1, limit: int = 10):
+        """Initialize instance properties."""
+        self.frames = frames
+        self.limit = limit
+
+        # properties
+        self.log = _logger
+        self._snapshot: tracemalloc.Snapshot | None = None
+        self._traced = 0
+        self._types: dict[str, int] = {}
+
+    @staticmethod
+    def log_directory() -> Path:
+        """Return the directory containing the leak check records."""
+        return Path.cwd() / 'log'
+
+    @property
+    def filename(self) -> Path:
+        """Return the leak check records filename for the current process."""
+        worker_id = os.getenv('PYTEST_XDIST_WORKER')
+        name = f'leak_check-{worker_id}.jsonl' if worker_id else 'leak_check.jsonl'
+        return self.log_directory() / name
+
+    def _take_snapshot(self) -> tracemalloc.Snapshot:
+        """Return a snapshot that excludes allocations made by the leak check and importlib."""
+        return tracemalloc.take_snapshot().filter_traces(
+            (
+                tracemalloc.Filter(inclusive=False, filename_pattern=__file__),
+                tracemalloc.Filter(inclusive=False, filename_pattern=tracemalloc.__file__),
+                tracemalloc.Filter(
+                    inclusive=False, filename_pattern='<frozen importlib._bootstrap>'
+                ),
+                tracemalloc.Filter(
+                    inclusive=False, filename_pattern='<frozen importlib._bootstrap_external>'
+                ),
+                tracemalloc.Filter(inclusive=False, filename_pattern='<unknown>'),
+            )
+        )
+
+    @staticmethod
+    def _type_counts() -> Counter:
+        """Return the number of live objects tracked by the garbage collector by type."""
+        return Counter(type(o).__name__ for o in gc.get_objects())
+
+    def start(self):
+        """Take the snapshot before the test runs."""
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.frames)
+
+        gc.collect()
+        self._snapshot = self._take_snapshot()
+        # store as a dict so the retained counts are attributed to this module (filtered)
+        self._types = dict(self._type_counts())
+        self._traced = tracemalloc.get_traced_memory()[0]
+
+    def stop(self, nodeid: str):
+        """Take the snapshot after the test runs and record the growth."""
+        if self._snapshot is None:
+            return
+
+        # count objects and traced memory before the snapshot adds its own allocations
+        gc.collect()
+        types = {
+            name: count - self._types.get(name, 0)
+            for name, count in self._type_counts().items()
+            if count > self._types.get(name, 0)
+        }
+        traced = tracemalloc.get_traced_memory()[0]
+        snapshot = self._take_snapshot()
+
+        # allocation sites that grew the most during the test
+        sites = [
+            {
+                'site': str(stat.traceback),
+                'size_diff': stat.size_diff,
+                'count_diff': stat.count_diff,
+            }
+            for stat in snapshot.compare_to(self._snapshot, 'lineno')
+            if stat.size_diff > 0
+        ][: self.limit]
+
+        # object types that are retained after the test
+        retained_types = sorted(types.items(), key=lambda x: x[1], reverse=True)[: self.limit]
+
+        record = {
+            'test': nodeid,
+            'worker': os.getenv('PYTEST_XDIST_WORKER'),
+            'traced_diff': traced - self._traced,
+            'traced': traced,
+            'sites': sites,
+            'types': dict(retained_types),
+        }
+        self.log.info(
+            f'step=teardown-method, event=leak-check, test={nodeid}, '
+            f'traced-diff={record["traced_diff"]}, traced={traced}'
+        )
+        for site in sites:
+            self.log.debug(
+                f'step=teardown-method, event=leak-check-site, site={site["site"]}, '
+                f'size-diff={site["size_diff"]}, count-diff={site["count_diff"]}'
+            )
+
+        try:
+            self.filename.parent.mkdir(parents=True, exist_ok=True)
+            with self.filename.open(mode='a', encoding='utf-8') as fh:
+                fh.write(json.dumps(record) + '\n')
+        except OSError:
+            self.log.exception('step=teardown-method, event=leak-check-write-failed')
+
+        self._snapshot = None
+        self._types = {}
+
+    @classmethod
+    def read(cls) -> list[dict]:
+        """Return the leak check records for all processes in the test session."""
+        records = []
+        for filename in sorted(cls.log_directory().glob('leak_check*.jsonl')):
+            with filename.open(encoding='utf-8') as fh:
+                records.extend(json.loads(line) for line in fh if line.strip())
+        return records
+
+    @classmethod
+    def summary(cls, limit: int = 10) -> list[str]:
+        """Return summary lines for the allocation sites and types that grew the most.
+
+        The first test of each process is excluded, since it includes the one time cost
+        of importing the App and its dependencies.
+        """
+        records = cls.read()
+
+        # exclude the first test per worker
+        workers_seen = set()
+        measured = []
+        for record in records:
+            if record.get('worker') in workers_seen:
+                measured.append(record)
+            workers_seen.add(record.get('worker'))
+        if not measured:
+            return []
+
+        sites: Counter = Counter()
+        types: Counter = Counter()
+        for record in measured:
+            sites.update({s['site']: s['size_diff'] for s in record['sites']})
+            types.update(record['types'])
+
+        traced_diff = sum(r['traced_diff'] for r in measured)
+        traced_diff_mean = traced_diff / len(measured)
+        lines = [
+            (
+                f'traced memory growth over {len(measured)} tests: {traced_diff / 1024:.1f} KB '
+                f'({traced_diff_mean / 1024:.1f} KB per test)'
+            ),
+            '',
+            f'{"allocation site":<80} {"growth":>12}',
+        ]
+        lines.extend(
+            f'{site[-80:]:<80} {size / 1024:>9.1f} KB' for site, size in sites.most_common(limit)
+        )
+        lines.append('')
+        lines.append(f'{"retained type":<80} {"objects":>12}')
+        lines.extend(f'{name[-80:]:<80} {count:>12}' for name, count in types.most_common(limit))
+        return lines
@@ -0,0 +1,135 @@
+"""TcEx Framework Module"""
+
+# standard library
+import functools
+import json
+import logging
+import os
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+
+# get logger
+_logger = logging.getLogger(__name__.split('.', maxsplit=1)[0])
+
+
+class PhaseTimer:
+    """Record the time spent in each phase (staging, run, validation, etc) of a profile.
+
+    One JSON record per profile is appended to log/timings.jsonl (timings-<worker>.jsonl
+    when running with pytest-xdist).
+    """
+
+    def __init__(self):
+        """Initialize instance properties."""
+        self.log = _logger
+        self.phases: dict[str, float] = {}
+        self.profile_name: str | None = None
+
+    @staticmethod
+    def log_directory() -> Path:
+        """Return the directory containing the timing records."""
+        return Path.cwd() / 'log'
+
+    @property
+    def filename(self) -> Path:
+        """Return the timing records filename for the current process."""
+        worker_id = os.getenv('PYTEST_XDIST_WORKER')
+        name = f'timings-{worker_id}.jsonl' if worker_id else 'timings.jsonl'
+        return self.log_directory() / name
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time the code in the context as the provided phase."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = self.phases.get(name, 0.0) + time.perf_counter() - start
+
+    def start(self, profile_name: str):
+        """Start recording phases for a new profile."""
+        self.phases = {}
+        self.profile_name = profile_name
+
+    def timed(self, name: str) -> Callable:
+        """Return a decorator that times the decorated method as the provided phase."""
+
+        def decorator(fn: Callable) -> Callable:
+            @functools.wraps(fn)
+            def wrapper(*args, **kwargs) -> Any:
+                with self.phase(name):
+                    return fn(*args, **kwargs)
+
+            return wrapper
+
+        return decorator
+
+    def write(self):
+        """Append the timing record for the current profile and reset the timer."""
+        if self.profile_name is None or not self.phases:
+            return
+
+        record = {
+            'test': os.getenv('PYTEST_CURRENT_TEST', '').split(' ')[0],
+            'profile': self.profile_name,
+            'worker': os.getenv('PYTEST_XDIST_WORKER'),
+            'phases': {k: round(v, 6) for k, v in self.phases.items()},
+            'total': round(sum(v for k, v in self.phases.items() if '.' not in k), 6),
+        }
+        self.log.info(
+            f'step=teardown-method, event=phase-timings, profile={self.profile_name}, '
+            f'total={record["total"]}'
+        )
+        try:
+            self.filename.parent.mkdir(parents=True, exist_ok=True)
+            with self.filename.open(mode='a', encoding='utf-8') as fh:
+                fh.write(json.dumps(record) + '\n')
+        except OSError:
+            self.log.exception('step=teardown-method, event=phase-timings-write-failed')
+
+        self.phases = {}
+        self.profile_name = None
+
+    @classmethod
+    def read(cls) -> list[dict]:
+        """Return the timing records for all processes in the test session."""
+        records = []
+        for filename in sorted(cls.log_directory().glob('timings*.jsonl')):
+            with filename.open(encoding='utf-8') as fh:
+                records.extend(json.loads(line) for line in fh if line.strip())
+        return records
+
+    @classmethod
+    def summary(cls, limit: int = 10) -> list[str]:
+        """Return summary lines for the slowest phases and profiles of the test session."""
+        records = cls.read()
+        if not records:
+            return []
+
+        # aggregate all records by phase
+        phases: dict[str, list[float]] = {}
+        for record in records:
+            for name, duration in record.get('phases', {}).items():
+                phases.setdefault(name, []).append(duration)
+
+        lines = [f'{"phase":<28} {"count":>6} {"total":>10} {"mean":>10} {"max":>10}']
+        for name, durations in sorted(phases.items(), key=lambda x: sum(x[1]), reverse=True)[
+            :limit
+        ]:
+            lines.append(
+                f'{name:<28} {len(durations):>6} {sum(durations):>9.3f}s '
+                f'{sum(durations) / len(durations):>9.3f}s {max(durations):>9.3f}s'
+            )
+
+        lines.append('')
+        lines.append(f'{"slowest profiles":<56} {"total":>10}  slowest phase')
+        for record in sorted(records, key=lambda x: x.get('total', 0), reverse=True)[:limit]:
+            slowest_phase = max(record['phases'].items(), key=lambda x: x[1])
+            lines.append(
+                f'{record["test"][-56:]:<56} {record["total"]:>9.3f}s  '
+                f'{slowest_phase[0]} ({slowest_phase[1]:.3f}s)'
+            )
+        return lines
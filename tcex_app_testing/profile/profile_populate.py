@@ -1,12 +1,23 @@
 """TcEx Framework Module"""
 
 # standard library
-import json
 import re
 from typing import Any
 
 # first-party
-from tcex_app_testing.render.render import Render
+from tcex_app_testing.profile.variable_template import Variable, VariableTemplate
+
+# the pattern for env variables (e.g., ${env:FOO} or ${remote:/path/to/key=default})
+ENV_VARIABLE_PATTERN = re.compile(r'\${(env|envs|local|remote):(.*?)}')
+
+
+def env_variable_args(variable: Variable) -> tuple[str, str, str | None]:
+    """Return the getenv args (env_variable, env_type, default) for an env variable."""
+    env_type, env_key = variable.groups
+    default_value = None
+    if '=' in env_key:
+        env_key, default_value = env_key.split('=', 1)
+    return env_key, env_type, default_value
 
 
 class ProfilePopulate:
@@ -27,6 +38,9 @@ class ProfilePopulate:
         does not contain a matching key.  A default value of '' will be used
         when this happens.
 
+        All distinct variables are resolved first (reading the required Vault secrets
+        concurrently), then the variables are replaced in a single pass over the data.
+
         An error is raised if the substitution would result in a new key
         pattern being formed, i.e. if the substitution text contains '${',
         which may or may not be expanded, or break profile expansion.
@@ -37,27 +51,20 @@ class ProfilePopulate:
         Returns:
             dict: The updated dict.
         """
-        profile = json.dumps(profile_data)
-
-        # TODO: update to named groups
-        for m in re.finditer(r'\${(env|envs|local|remote):(.*?)}', profile):
-            try:
-                full_match = m.group(0)
-                env_type = m.group(1)  # currently env, envs, local, or remote
-                env_key = m.group(2)
-                if '=' in env_key:
-                    env_key, default_value = env_key.split('=', 1)
-                else:
-                    default_value = None
-
-                env_value = self.profile.env_store.getenv(env_key, env_type, default_value)
-                if env_value is not None:
-                    if '${' in env_value:
-                        self.profile.log.error(
-                            f'Profile replacement value for {full_match} includes '
-                            f'recursive expansion {env_value}'
-                        )
-                    profile = profile.replace(full_match, env_value)
-            except IndexError:
-                Render.panel.warning(f'Could not replace variable {m.group(0)}.')
-        return json.loads(profile)
+        template = VariableTemplate(profile_data, ENV_VARIABLE_PATTERN)
+
+        # phase 1: resolve all distinct variables (vault reads are concurrent)
+        env_variables = {v: env_variable_args(v) for v in template.variables}
+        env_values = self.profile.env_store.getenv_many(env_variables.values())
+
+        # phase 2: replace all variables in a single pass
+        def resolve(variable: Variable) -> str | None:
+            env_value = env_values.get(env_variables[variable])
+            if env_value is not None and '${' in env_value:
+                self.profile.log.error(
+                    f'Profile replacement value for {variable.text} includes '
+                    f'recursive expansion {env_value}'
+                )
+            return env_value
+
+        return template.render(resolve)
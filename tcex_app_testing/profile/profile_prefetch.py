@@ -0,0 +1,94 @@
+"""TcEx Framework Module"""
+
+# standard library
+import json
+import logging
+import threading
+from collections.abc import Iterable
+from pathlib import Path
+
+# first-party
+from tcex_app_testing.config_model import config_model
+from tcex_app_testing.env_store import EnvStore
+from tcex_app_testing.profile.profile_populate import ENV_VARIABLE_PATTERN, env_variable_args
+from tcex_app_testing.profile.variable_template import VariableTemplate
+from tcex_app_testing.stager.stager_vault import StagerVault
+
+# get logger
+_logger = logging.getLogger(__name__.split('.', maxsplit=1)[0])
+
+
+class ProfilePrefetch:
+    """Warm the EnvStore secret cache for the profiles of a feature.
+
+    The Vault secrets of the env variables (e.g., ${env:FOO} or ${remote:/path/to/key}) and
+    the stage.vault secrets of the profiles that run in the current environments are read in
+    a background thread, so that the Vault reads overlap test collection instead of delaying
+    the first test that needs them. The variables themselves are resolved by each test, and
+    errors are only logged, so that nothing is rendered during collection.
+
+    Args:
+        profiles_path: The profiles.d directory of the feature.
+        environments: The current test environments, defaults to TCEX_TEST_ENVS.
+    """
+
+    def __init__(self, profiles_path: Path, environments: Iterable[str] | None = None):
+        """Initialize instance properties."""
+        self.environments = set(environments or config_model.os_environments)
+        self.profiles_path = profiles_path
+
+        # properties
+        self.env_store = EnvStore()
+        self.log = _logger
+
+    def _profiles(self) -> list[dict]:
+        """Return the contents of the profiles that run in the current environments."""
+        profiles = []
+        for filename in sorted(self.profiles_path.glob('*.json')):
+            try:
+                with filename.open(encoding='utf-8') as fh:
+                    profile = json.load(fh)
+            except (OSError, ValueError):
+                self.log.warning(f'step=collect, event=prefetch-invalid-profile, file={filename}')
+                continue
+
+            # profiles for other environments are skipped by the test (see check_environment)
+            if self.environments.intersection(profile.get('environments') or ['build']):
+                profiles.append(profile)
+        return profiles
+
+    def prefetch(self):
+        """Read the Vault secrets of the env variables and stage.vault of the profiles."""
+        profiles = self._profiles()
+
+        # the env variables of the profiles (local variables do not read from Vault)
+        template = VariableTemplate(profiles, ENV_VARIABLE_PATTERN)
+        env_variables = [env_variable_args(v) for v in template.variables if v.groups[0] != 'local']
+
+        # the secrets staged with stage.vault
+        stager_vault = StagerVault()
+        secret_paths = [
+            stager_vault.secret_path(url)
+            for profile in profiles
+            for url in (profile.get('stage') or {}).get('vault', {}).values()
+            if isinstance(url, str)
+        ]
+
+        self.log.info(
+            f'step=collect, event=prefetch, path={self.profiles_path}, '
+            f'env-variables={len(env_variables)}, vault-secrets={len(secret_paths)}'
+        )
+        try:
+            secret_paths.extend(self.env_store.secret_paths(env_variables))
+            self.env_store.read_secrets(secret_paths, render=False)
+        except Exception:
+            # prefetch is an optimization, the values are resolved again by each test
+            self.log.exception('step=collect, event=prefetch-failed')
+
+    def start(self) -> threading.Thread:
+        """Run the prefetch in a background (daemon) thread."""
+        thread = threading.Thread(
+            target=self.prefetch, name=f'prefetch-{self.profiles_path.parent.name}', daemon=True
+        )
+        thread.start()
+        return thread
@@ -15,6 +15,8 @@ from tcex_app_testing.profile.profile import Profile
 from tcex_app_testing.profile.profile_migrate import ProfileMigrate
 from tcex_app_testing.profile.profile_update import ProfileUpdate
 from tcex_app_testing.profile.profile_validate import ProfileValidate
+from tcex_app_testing.stager.kvstore_contexts import kvstore_contexts
+from tcex_app_testing.validator.kvstore_snapshot import kvstore_snapshot
 
 
 class ProfileRunner(Profile):
@@ -57,16 +59,14 @@ class ProfileRunner(Profile):
             record=self.pytestconfig.option.record,
         )
 
-    def clear_context(self, context):
+    def clear_context(self, context) -> int:
         """Clear all context data in redis.
 
         Args:
             context (str): The context (session_id) to clear in KV store.
         """
-        keys = self.redis_client.hkeys(context)
-        if keys:
-            return self.redis_client.hdel(context, *keys)  # type: ignore
-        return 0
+        kvstore_snapshot.clear(context)
+        return kvstore_contexts.delete(self.redis_client, [context])
 
     @cached_property
     def contents(self) -> dict:
@@ -1,11 +1,11 @@
 """TcEx Framework Module"""
 
 # standard library
-import json
 from typing import TYPE_CHECKING, Any
 
 # first-party
 from tcex_app_testing.config_model import config_model
+from tcex_app_testing.validator.kvstore_snapshot import kvstore_snapshot
 
 from .profile_output_validation_rules import ProfileOutputValidationRules
 
@@ -32,20 +32,16 @@ class ProfileUpdate:
         self.redis_client = profile.redis_client
         self.rules = ProfileOutputValidationRules()
 
-    def _generate_output_data(self, outputs: dict, redis_data: dict):
+    def _generate_output_data(self, outputs: dict, context: str):
         """Return the outputs section of a profile.
 
         Args:
             outputs: The dict to add outputs.
-            redis_data: The data from KV store for this profile.
+            context: The KV store context for this profile.
         """
         for variable in self.profile.tc_playbook_out_variables:
-            # get data from redis for current context
-            data = redis_data.get(variable.encode('utf-8'))
-
-            if data is not None:
-                # redis return bytes, convert to str and de-serialize
-                data = json.loads(data.decode('utf-8'))
+            # get data from the snapshot of the current context
+            data = kvstore_snapshot.value(self.redis_client, context, variable)  # type: ignore
 
             # make business rules based on data type or content
             output_data = {'expected_output': data, 'op': 'eq'}
@@ -119,11 +115,8 @@ class ProfileUpdate:
 
         outputs = {}
         for context in self.profile.context_tracker:
-            # get all current keys in current context
-            redis_data = self.redis_client.hgetall(context)
-
             # updated outputs with validation data
-            self._generate_output_data(outputs, redis_data)  # type: ignore
+            self._generate_output_data(outputs, context)
 
             # cleanup redis
             self.profile.clear_context(context)
@@ -1,13 +1,13 @@
 """TcEx Framework Module"""
 
 # standard library
-import json
 from typing import TYPE_CHECKING
 
 # first-party
 from tcex_app_testing.config_model import config_model
 from tcex_app_testing.util import Util
 from tcex_app_testing.util.code_operation import CodeOperation
+from tcex_app_testing.validator.kvstore_snapshot import kvstore_snapshot
 
 if TYPE_CHECKING:
     # first-party
@@ -92,18 +92,11 @@ class ProfileValidate:
             raise RuntimeError(ex_msg)
 
         for context in self.profile.context_tracker:
-            context_keys = [
-                k.decode('utf-8')
-                for k in self.redis_client.hkeys(context)  # type: ignore
-            ]
+            context_keys = kvstore_snapshot.keys(self.redis_client, context)
             self.log.info(f'step=validate, event=validate-outputs, context-keys={context_keys}')
             for variable in self.profile.tc_playbook_out_variables:
-                # get data from redis for current context
-                data = self.redis_client.hget(context, variable.encode('utf-8'))  # type: ignore
-
-                # TODO: does this need to use playbooks?
-                if data is not None:
-                    data = json.loads(data.decode('utf-8'))  # type: ignore
+                # get data from the snapshot of the current context
+                data = kvstore_snapshot.value(self.redis_client, context, variable)
 
                 # validate string-specific checks only when data is a string
                 if isinstance(data, str):
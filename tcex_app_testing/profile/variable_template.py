@@ -0,0 +1,115 @@
+"""TcEx Framework Module"""
+
+# standard library
+import re
+from collections.abc import Callable
+from functools import lru_cache
+from typing import Any, NamedTuple
+
+# third-party
+import jmespath
+from jmespath.parser import ParsedResult
+
+# the pattern for staged data variables (e.g., ${tc.group.name} or ${vault.api_key})
+VARIABLE_PATTERN = re.compile(r'\${(.*?)}')
+
+
+class Variable(NamedTuple):
+    """A variable found in a profile string (e.g., text="${tc.group.name}")."""
+
+    text: str
+    groups: tuple[str, ...]
+
+
+class Segments(tuple):
+    """The literal (str) and Variable segments of a profile string that contains variables."""
+
+    __slots__ = ()
+
+
+@lru_cache(maxsize=1024)
+def compile_expression(expression: str) -> ParsedResult:
+    """Return the compiled jmespath expression."""
+    return jmespath.compile(expression)
+
+
+def tokenize(value: str, pattern: re.Pattern = VARIABLE_PATTERN) -> str | Segments:
+    """Return the segments of the value or the value if it does not contain any variables."""
+    segments: list[str | Variable] = []
+    position = 0
+    for m in pattern.finditer(value):
+        if m.start() > position:
+            segments.append(value[position : m.start()])
+        segments.append(Variable(m.group(0), m.groups()))
+        position = m.end()
+
+    if not segments:
+        return value
+
+    if position < len(value):
+        segments.append(value[position:])
+    return Segments(segments)
+
+
+class VariableTemplate:
+    """Profile data compiled into literal and variable segments.
+
+    The data is tokenized once. Each call to render walks the compiled data and replaces
+    the variables, without serializing the data to JSON or scanning it with a regex again.
+    Repeated strings are tokenized once per template, and the tokens are not kept after
+    compiling, so large strings (e.g., staged payloads) are not retained for the session.
+
+    Args:
+        data: The profile data (dict, list, str, etc).
+        pattern: The regex pattern for variables.
+    """
+
+    def __init__(self, data: Any, pattern: re.Pattern = VARIABLE_PATTERN):
+        """Initialize instance properties."""
+        self.pattern = pattern
+
+        # properties
+        self.variables: set[Variable] = set()
+        self._tokens: dict[str, str | Segments] = {}
+        self._compiled = self._compile(data)
+
+        # the tokens are only reused while compiling
+        self._tokens.clear()
+
+    def _compile(self, data: Any) -> Any:
+        """Return the data with all strings that contain variables replaced by Segments."""
+        if isinstance(data, dict):
+            return {self._compile(k): self._compile(v) for k, v in data.items()}
+        if isinstance(data, list):
+            return [self._compile(v) for v in data]
+        if isinstance(data, str):
+            segments = self._tokens.get(data)
+            if segments is None:
+                segments = self._tokens[data] = tokenize(data, self.pattern)
+            if isinstance(segments, Segments):
+                self.variables.update(s for s in segments if isinstance(s, Variable))
+            return segments
+        return data
+
+    def render(self, resolve: Callable[[Variable], str | None]) -> Any:
+        """Return a copy of the data with the variables replaced.
+
+        Args:
+            resolve: Callable that returns the replacement for a variable, or None to keep
+                the variable text unchanged. It is called once per unique variable.
+        """
+        values: dict[Variable, str] = {}
+        for variable in self.variables:
+            value = resolve(variable)
+            values[variable] = variable.text if value is None else value
+
+        def _render(node: Any) -> Any:
+            if isinstance(node, Segments):
+                return ''.join(values[s] if isinstance(s, Variable) else s for s in node)
+            if isinstance(node, dict):
+                return {_render(k): _render(v) for k, v in node.items()}
+            if isinstance(node, list):
+                return [_render(v) for v in node]
+            return node
+
+        return _render(self._compiled)
@@ -24,6 +24,49 @@ class Render(RenderUtil):
         text.append(' • Using "null" or \'null\' to insert a string of null.')
         print_(Panel(text, title='Help', title_align=cls.title_align))
 
+    @classmethod
+    def table_bench(cls, results: list[dict], summary: dict[str, str], title: str):
+        """Render bench iteration results and summary in tables."""
+        table = Table(
+            border_style='dim',
+            expand=True,
+            show_edge=False,
+        )
+
+        table.add_column('Iteration', header_style=cls.accent, justify='right', style=cls.accent2)
+        table.add_column('Outcome', header_style=cls.accent, justify='left')
+        table.add_column('Elapsed', header_style=cls.accent, justify='right')
+        table.add_column('RSS Delta', header_style=cls.accent, justify='right')
+        table.add_column('Peak Traced', header_style=cls.accent, justify='right')
+        table.add_column('Redis Commands', header_style=cls.accent, justify='right')
+
+        for iteration, result in enumerate(results, start=1):
+            table.add_row(
+                str(iteration),
+                result['outcome'],
+                f'{result["elapsed"]:.3f}s',
+                f'{result["rss_delta"] / 1024:+.1f} MB',
+                f'{result["tracemalloc_peak"] / 1024:.1f} KB',
+                str(result['redis_commands']),
+            )
+
+        print_(Panel(table, title=title, title_align=cls.title_align))
+
+        summary_table = Table(
+            border_style='',
+            expand=True,
+            show_edge=False,
+            show_header=False,
+        )
+
+        summary_table.add_column('Field', justify='left', style=cls.accent2, no_wrap=True)
+        summary_table.add_column('Value', justify='left', style='bold')
+
+        for key, value in summary.items():
+            summary_table.add_row(key, value)
+
+        print_(Panel(summary_table, title=f'{title} Summary', title_align=cls.title_align))
+
     @classmethod
     def table_file_results(cls, row_data: list[list[str]], title: str):
         """Render template create results in a table."""
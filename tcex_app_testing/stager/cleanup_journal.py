@@ -0,0 +1,206 @@
+"""TcEx Framework Module"""
+
+# standard library
+import json
+import logging
+import time
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# first-party
+from tcex_app_testing.cache import FileCache, FileLock
+from tcex_app_testing.config_model import config_model
+from tcex_app_testing.pleb.cached_property import cached_property
+from tcex_app_testing.requests_tc import TcSession
+from tcex_app_testing.requests_tc.auth.tc_auth import TcAuth
+
+# get logger
+_logger = logging.getLogger(__name__.split('.', maxsplit=1)[0])
+
+
+class CleanupJournal:
+    """Journal of the data staged in ThreatConnect that has not been removed yet.
+
+    Staged items are appended to a JSON lines file in the pytest cache as soon as they are
+    created, and marked as removed once they are deleted. Items that are still in the journal
+    (cleanup deferred with --defer_cleanup, failed deletes or aborted runs) are deleted
+    concurrently when the journal is drained at the end of the test session.
+
+    Each entry records the API host (and owner) it was staged on. Only the entries of the
+    current host are deleted, the entries of other ThreatConnect instances are kept until a
+    session runs against that instance again.
+
+    Args:
+        filename: Optional journal filename.
+    """
+
+    max_workers = 8
+    retries = 3
+
+    def __init__(self, filename: Path | None = None):
+        """Initialize instance properties."""
+        self.filename = filename or FileCache.default_cache_dir() / 'tc_cleanup.jsonl'
+
+        # properties
+        self.lock = FileLock(self.filename.with_suffix('.lock'))
+        self.log = _logger
+
+    def _append(
+        self,
+        action: str,
+        entries: Iterable[tuple[str, str]],
+        owners: dict[tuple[str, str], str] | None = None,
+    ):
+        """Append the entries to the journal."""
+        owners = owners or {}
+        lines = [
+            self._line(action, {'owner': owners.get((t, i)), 'type': t, 'id': i})
+            for t, i in entries
+        ]
+        if not lines:
+            return
+
+        with self.lock:
+            self.filename.parent.mkdir(parents=True, exist_ok=True)
+            with self.filename.open(mode='a', encoding='utf-8') as fh:
+                fh.writelines(lines)
+
+    def _line(self, action: str, record: dict) -> str:
+        """Return the journal line for the record of the current host."""
+        return json.dumps({'action': action, 'host': self.host, **record}) + '\n'
+
+    def _records(self) -> dict[tuple[str, str, str], dict]:
+        """Return the records (of all hosts) that have been added and not removed."""
+        records: dict[tuple[str, str, str], dict] = {}
+        with self.lock:
+            try:
+                with self.filename.open(encoding='utf-8') as fh:
+                    lines = fh.readlines()
+            except OSError:
+                return {}
+
+        for line in lines:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                # a partially written line from an aborted run
+                continue
+
+            key = (record.get('host', ''), record['type'], str(record['id']))
+            if record['action'] == 'add':
+                records[key] = {'owner': record.get('owner'), 'type': key[1], 'id': key[2]}
+            else:
+                records.pop(key, None)
+        return records
+
+    def add(
+        self,
+        entries: Iterable[tuple[str, str]],
+        owners: dict[tuple[str, str], str] | None = None,
+    ):
+        """Add the (type, id) of staged data to the journal.
+
+        Args:
+            entries: The (type, id) of the staged data.
+            owners: Optional owner name of each entry.
+        """
+        self._append('add', entries, owners)
+
+    def delete(self, session: TcSession, entries: list[tuple[str, str]]) -> list[tuple[str, str]]:
+        """Delete the entries concurrently and return the entries that could not be deleted."""
+        if not entries:
+            return []
+
+        def _delete(entry: tuple[str, str]) -> bool:
+            type_, id_ = entry
+            for attempt in range(self.retries):
+                try:
+                    response = session.delete(f'/v3/{type_}/{id_}')
+                    # the data was already removed (e.g., by a previous drain)
+                    if response.ok or response.status_code == 404:  # noqa: PLR2004
+                        return True
+                    message = f'{response.status_code} {response.text}'
+                except Exception as ex:
+                    message = str(ex)
+
+                self.log.warning(
+                    f'step=cleanup, event=cleanup-retry, type={type_}, id={id_}, '
+                    f'attempt={attempt + 1}, message={message}'
+                )
+                if attempt < self.retries - 1:
+                    time.sleep(0.5 * 2**attempt)
+            return False
+
+        with ThreadPoolExecutor(
+            max_workers=min(self.max_workers, len(entries)), thread_name_prefix='tc-cleanup'
+        ) as executor:
+            results = list(executor.map(_delete, entries))
+
+        self.remove(e for e, deleted in zip(entries, results, strict=True) if deleted)
+        return [e for e, deleted in zip(entries, results, strict=True) if not deleted]
+
+    def drain(self, session: TcSession | None = None) -> dict[str, int]:
+        """Delete the entries of the current host and return a summary of the results."""
+        with self.lock:
+            records = self._records()
+            entries = [(k[1], k[2]) for k in records if k[0] == self.host]
+            if not entries:
+                return {}
+
+            self.log.info(f'step=cleanup, event=drain-cleanup-journal, count={len(entries)}')
+            failed = set(self.delete(session or self.session, entries))
+
+            # compact the journal to the entries that could not be deleted and the entries
+            # of other hosts
+            self.filename.write_text(
+                ''.join(
+                    json.dumps({'action': 'add', 'host': k[0], **record}) + '\n'
+                    for k, record in records.items()
+                    if k[0] != self.host or (k[1], k[2]) in failed
+                ),
+                encoding='utf-8',
+            )
+        return {'deleted': len(entries) - len(failed), 'failed': len(failed)}
+
+    def entries(self) -> list[tuple[str, str]]:
+        """Return the entries of the current host that have been added and not removed."""
+        return [(k[1], k[2]) for k in self._records() if k[0] == self.host]
+
+    @cached_property
+    def host(self) -> str:
+        """Return the ThreatConnect API host the entries are staged on."""
+        return config_model.tc_api_path.rstrip('/')
+
+    def remove(self, entries: Iterable[tuple[str, str]]):
+        """Mark the entries as removed."""
+        self._append('remove', entries)
+
+    @cached_property
+    def session(self) -> TcSession:
+        """Return a session for draining the journal outside of a test case."""
+        auth = TcAuth(
+            tc_api_access_id=config_model.tc_api_access_id,
+            tc_api_secret_key=config_model.tc_api_secret_key,
+        )
+        return TcSession(auth, config_model.tc_api_path)
+
+    @staticmethod
+    def staged_owners(staged_data: dict) -> dict[tuple[str, str], str]:
+        """Return the owner name of the staged data."""
+        return {
+            (root_key, str(data.get('id'))): data['ownerName']
+            for root_key, root_value in staged_data.items()
+            for data in root_value.values()
+            if data.get('id') is not None and data.get('ownerName')
+        }
+
+    @staticmethod
+    def staged_entries(staged_data: dict) -> list[tuple[str, str]]:
+        """Return the (type, id) of the staged data."""
+        return [
+            (root_key, str(data.get('id')))
+            for root_key, root_value in staged_data.items()
+            for data in root_value.values()
+            if data.get('id') is not None
+        ]
@@ -0,0 +1,129 @@
+"""TcEx Framework Module"""
+
+# standard library
+import logging
+import threading
+import time
+from collections.abc import Iterable
+
+# third-party
+from redis import Redis
+from redis.client import Pipeline
+from redis.exceptions import RedisError, ResponseError
+
+# first-party
+from tcex_app_testing.config_model import config_model
+from tcex_app_testing.pleb.cached_property import cached_property
+
+# get logger
+_logger = logging.getLogger(__name__.split('.', maxsplit=1)[0])
+
+
+class KvstoreContexts:
+    """Lifecycle of the kv store contexts created by the test session.
+
+    Each context hash that is staged gets an expiry (TCEX_TEST_CONTEXT_TTL, default 3600
+    seconds) and is added to a sorted set scored by that expiry, so that contexts left behind
+    by crashed runs do not stay in a shared (long-lived) Redis. Contexts are deleted with
+    UNLINK, which frees the memory in a background thread of the server. The contexts of the
+    session are purged when it finishes and expired contexts of previous sessions when the
+    next one starts.
+    """
+
+    # the sorted set of tracked contexts (score is the expiry epoch)
+    key = 'tcex-app-testing:contexts'
+
+    # the number of contexts deleted per command
+    chunk_size = 1000
+
+    def __init__(self):
+        """Initialize instance properties."""
+        self.log = _logger
+
+        # properties
+        self._contexts: set[str] = set()
+        self._lock = threading.Lock()
+        self._unlink = True
+
+    @cached_property
+    def redis_client(self) -> Redis:
+        """Return a Redis client for purging contexts outside of a test case."""
+        return Redis(
+            host=config_model.tc_kvstore_host,
+            port=int(config_model.tc_kvstore_port),
+            db=config_model.tc_playbook_kvstore_id,
+        )
+
+    def delete(self, redis_client: Redis, contexts: Iterable[str]) -> int:
+        """Delete the contexts and return the number of contexts that existed."""
+        contexts = list(contexts)
+        if not contexts:
+            return 0
+
+        with self._lock:
+            self._contexts.difference_update(contexts)
+
+        deleted = 0
+        for i in range(0, len(contexts), self.chunk_size):
+            chunk = contexts[i : i + self.chunk_size]
+            pipeline = redis_client.pipeline(transaction=False)
+            if self._unlink:
+                pipeline.unlink(*chunk)
+            else:
+                pipeline.delete(*chunk)
+            pipeline.zrem(self.key, *chunk)
+            try:
+                deleted += pipeline.execute()[0]
+            except ResponseError:
+                if not self._unlink:
+                    raise
+                # UNLINK requires Redis 4.0
+                self.log.info('step=cleanup, event=kvstore-unlink-unsupported')
+                self._unlink = False
+                return deleted + self.delete(redis_client, contexts[i:])
+        return deleted
+
+    def purge(self, redis_client: Redis | None = None, expired: bool = False) -> int:
+        """Delete the contexts of this session, or the expired contexts of any session.
+
+        Args:
+            redis_client: The Redis client, defaults to a client for the configured KV store.
+            expired: If True, delete the contexts that expired instead of the session contexts.
+        """
+        redis_client = redis_client or self.redis_client
+        try:
+            if expired:
+                contexts = [
+                    c.decode() if isinstance(c, bytes) else c
+                    for c in redis_client.zrangebyscore(self.key, '-inf', time.time())  # type: ignore
+                ]
+            else:
+                with self._lock:
+                    contexts = list(self._contexts)
+            deleted = self.delete(redis_client, contexts)
+        except RedisError as ex:
+            # purging is best effort, the contexts still expire
+            self.log.warning(f'step=cleanup, event=kvstore-purge-failed, message={ex}')
+            return 0
+
+        if contexts:
+            self.log.info(
+                f'step=cleanup, event=kvstore-purge, expired={expired}, '
+                f'contexts={len(contexts)}, deleted={deleted}'
+            )
+        return deleted
+
+    def track(self, pipeline: Pipeline, context: str):
+        """Add the commands that set the expiry and track the context to the pipeline.
+
+        The commands must be added after the commands that create the context hash.
+        """
+        ttl = config_model.test_context_ttl
+        with self._lock:
+            self._contexts.add(context)
+        pipeline.expire(context, ttl)
+        pipeline.zadd(self.key, {context: time.time() + ttl})
+
+
+# shared by all test cases in the test session (process)
+kvstore_contexts = KvstoreContexts()
@@ -0,0 +1,70 @@
+"""TcEx Framework Module"""
+
+# standard library
+import copy
+import hashlib
+import json
+import logging
+import threading
+
+# get logger
+_logger = logging.getLogger(__name__.split('.', maxsplit=1)[0])
+
+
+class StagedRegistry:
+    """Session registry of ThreatConnect objects shared by profiles that stage identical data.
+
+    Objects are keyed by a hash of the type and canonical payload. The first profile that
+    stages an object creates it, later profiles reuse it (read-only) and a reference count
+    tracks the profiles currently using it. Shared objects are not deleted by the profile
+    cleanup, they stay in the cleanup journal and are deleted when it is drained at the end
+    of the test session.
+    """
+
+    def __init__(self):
+        """Initialize instance properties."""
+        self.log = _logger
+
+        # properties
+        self._ids: dict[tuple[str, str], str] = {}
+        self._lock = threading.Lock()
+        self._objects: dict[str, dict] = {}
+        self._refs: dict[str, int] = {}
+
+    @staticmethod
+    def key(root_key: str, data: dict) -> str:
+        """Return the content hash for the staged payload."""
+        payload = json.dumps(data, sort_keys=True, separators=(',', ':'))
+        return hashlib.sha256(f'{root_key}|{payload}'.encode()).hexdigest()
+
+    def acquire(self, key: str) -> dict | None:
+        """Return a copy of the shared object and increment its reference count."""
+        with self._lock:
+            staged = self._objects.get(key)
+            if staged is None:
+                return None
+            self._refs[key] += 1
+        self.log.debug(f'step=setup, event=staged-registry-reuse, key={key}')
+        return copy.deepcopy(staged)
+
+    def register(self, key: str, root_key: str, staged: dict):
+        """Add a newly staged object with a reference count of one."""
+        with self._lock:
+            self._ids[(root_key, str(staged.get('id')))] = key
+            self._objects[key] = copy.deepcopy(staged)
+            self._refs[key] = 1
+
+    def release(self, root_key: str, id_: str) -> bool:
+        """Decrement the reference count and return True if the object is shared."""
+        with self._lock:
+            key = self._ids.get((root_key, id_))
+            if key is None:
+                return False
+            self._refs[key] = max(self._refs[key] - 1, 0)
+            if self._refs[key] == 0:
+                self.log.debug(f'step=cleanup, event=staged-registry-idle, key={key}')
+            return True
+
+
+# shared by all profiles in the test session (process)
+staged_registry = StagedRegistry()
@@ -3,14 +3,24 @@
 # standard library
 import base64
 import binascii
+import hashlib
+import json
 import logging
+import mmap
+from collections.abc import Iterator
+from contextlib import ExitStack, contextmanager
+from pathlib import Path
+from typing import Any, ClassVar
 
 # third-party
 from redis import Redis
+from redis.exceptions import ResponseError
 
 # first-party
 from tcex_app_testing.app.playbook import Playbook
+from tcex_app_testing.config_model import config_model
 from tcex_app_testing.render.render import Render
+from tcex_app_testing.stager.kvstore_contexts import kvstore_contexts
 
 # get logger
 _logger = logging.getLogger(__name__.split('.', maxsplit=1)[0])
@@ -19,6 +29,18 @@ _logger = logging.getLogger(__name__.split('.', maxsplit=1)[0])
 class StagerKvstore:
     """Stages the Redis Data"""
 
+    # the command used to clone a template hash (COPY, or RESTORE when COPY is not supported)
+    clone_command: ClassVar[str] = 'COPY'
+
+    # the number of bytes of a staging file that are base64 encoded at a time (multiple of 3)
+    encode_chunk_size = 3 * 1024 * 1024
+
+    # the template hashes created by this process
+    templates: ClassVar[set[str]] = set()
+
+    # the number of seconds a template hash is kept in redis
+    template_ttl = 3600
+
     def __init__(self, playbook: Playbook, redis_client: Redis):
         """Initialize class properties."""
         self.playbook = playbook
@@ -27,13 +49,15 @@ class StagerKvstore:
         # properties
         self.log = _logger
 
-    def from_dict(self, staging_data: dict):
-        """Stage redis data from dict"""
+    def _create(self, staging_data: dict, writes: dict[str, dict]):
+        """Create the variables with Playbook.create."""
         for variable, data in staging_data.items():
             variable_type = self.playbook.get_variable_type(variable)
             self.log.info(f'step=stage, data=from-dict, variable={variable}, value={data}')
 
-            if data is not None:
+            if self._is_file_reference(data, variable_type):
+                self._create_from_file(variable, variable_type, data, writes)
+            elif data is not None:
                 if variable_type == 'Binary':
                     data_ = self._decode_binary(data, variable)
                 elif variable_type == 'BinaryArray':
@@ -48,6 +72,168 @@ class StagerKvstore:
                     when_requested=False,  # type: ignore
                 )
 
+    def _create_from_file(
+        self, variable: str, variable_type: str, data: str | list, writes: dict[str, dict]
+    ):
+        """Create a Binary or BinaryArray variable with data read from files.
+
+        A placeholder is created with Playbook.create to get the context and key, then the
+        value is replaced with the serialized file data (a JSON string of the base64 encoded
+        data, the format used by Playbook.create for Binary variables).
+        """
+        placeholder = b'\0' if variable_type == 'Binary' else [b'\0']
+        self.playbook.create.any(
+            variable,
+            placeholder,  # type: ignore
+            validate=False,
+            when_requested=False,  # type: ignore
+        )
+
+        if variable_type == 'Binary':
+            value = self._encode_binary([data], variable)  # type: ignore
+        else:
+            value = self._encode_binary(data, variable, array=True)  # type: ignore
+
+        key = variable.strip()
+        for mapping in writes.values():
+            if key in mapping:
+                mapping[key] = value
+
+    def from_dict(self, staging_data: dict):
+        """Stage redis data from dict.
+
+        The variables are serialized by Playbook.create (e.g., Binary data is base64 encoded),
+        but the HSET calls are collected and written with a single pipelined HSET per context,
+        so that staging any number of variables takes one round trip.
+        """
+        with self.collect_writes() as writes:
+            self._create(staging_data, writes)
+        self.write(writes)
+
+    def from_template(self, context: str, staging_data: dict, unique_data: dict):
+        """Stage data that is identical for every test by cloning a template hash.
+
+        The staging data is serialized and written to a template hash once, then copied
+        server-side into the context of each test (COPY, or DUMP/RESTORE when the server does
+        not support COPY). The unique data (e.g., a timestamp) is written on top.
+
+        Args:
+            context: The kv store context of the current test.
+            staging_data: The data that is identical for every test.
+            unique_data: The data that is staged on top of the template.
+        """
+        template = self._template(context, staging_data)
+        if template is None:
+            self.from_dict({**staging_data, **unique_data})
+            return
+
+        with self.collect_writes() as writes:
+            self._create(unique_data, writes)
+
+        copied = False
+        if self.clone_command == 'COPY':
+            try:
+                copied = self._clone_copy(template, context, writes)
+            except ResponseError:
+                self.log.info('step=stage, event=kvstore-copy-unsupported')
+                StagerKvstore.clone_command = 'RESTORE'
+        if self.clone_command == 'RESTORE':
+            copied = self._clone_restore(template, context, writes)
+
+        if not copied:
+            # the template expired or was removed, stage the data directly
+            self.templates.discard(template)
+            self.from_dict({**staging_data, **unique_data})
+
+    def _clone_copy(self, template: str, context: str, writes: dict[str, dict]) -> bool:
+        """Copy the template to the context and write the unique data in one round trip."""
+        pipeline = self.redis_client.pipeline(transaction=False)
+        pipeline.copy(template, context, replace=True)
+        for name, mapping in writes.items():
+            pipeline.hset(name, mapping=mapping)
+        kvstore_contexts.track(pipeline, context)
+        return bool(pipeline.execute()[0])
+
+    def _clone_restore(self, template: str, context: str, writes: dict[str, dict]) -> bool:
+        """Restore a dump of the template to the context and write the unique data."""
+        dump = self.redis_client.dump(template)
+        if dump is None:
+            return False
+
+        pipeline = self.redis_client.pipeline(transaction=False)
+        pipeline.restore(context, 0, dump, replace=True)
+        for name, mapping in writes.items():
+            pipeline.hset(name, mapping=mapping)
+        kvstore_contexts.track(pipeline, context)
+        pipeline.execute()
+        return True
+
+    def _template(self, context: str, staging_data: dict) -> str | None:
+        """Return the name of the template hash for the data, creating it if required.
+
+        None is returned when the data does not contain any variables to stage.
+        """
+        digest = hashlib.sha256(
+            json.dumps(staging_data, sort_keys=True, default=str).encode()
+        ).hexdigest()
+        template = f'tcex-app-testing:template:{digest[:16]}'
+        if template in self.templates:
+            return template
+
+        # serialize the data for the context of the test and write it to the template hash
+        with self.collect_writes() as writes:
+            self._create(staging_data, writes)
+        mapping = writes.pop(context, {})
+        self.write(writes)
+        if not mapping:
+            return None
+
+        pipeline = self.redis_client.pipeline(transaction=False)
+        pipeline.delete(template)
+        pipeline.hset(template, mapping=mapping)
+        pipeline.expire(template, self.template_ttl)
+        pipeline.execute()
+
+        self.templates.add(template)
+        self.log.info(f'step=stage, event=kvstore-template-created, template={template}')
+        return template
+
+    @contextmanager
+    def collect_writes(self) -> Iterator[dict[str, dict]]:
+        """Collect the HSET calls made to the redis client instead of sending them."""
+        writes: dict[str, dict] = {}
+
+        def _hset(name, key=None, value=None, mapping=None, items=None):
+            context = writes.setdefault(name, {})
+            if key is not None:
+                context[key] = value
+            context.update(mapping or {})
+            context.update(zip(items[::2], items[1::2], strict=True) if items else {})
+            return 1
+
+        self.redis_client.hset = _hset  # type: ignore
+        try:
+            yield writes
+        finally:
+            # remove the instance attribute to restore the Redis.hset method
+            del self.redis_client.hset
+
+    def write(self, writes: dict[str, dict]):
+        """Write the collected variables with one HSET per context in a single round trip."""
+        if not writes:
+            return
+
+        pipeline = self.redis_client.pipeline(transaction=False)
+        for context, mapping in writes.items():
+            if mapping:
+                pipeline.hset(context, mapping=mapping)
+                kvstore_contexts.track(pipeline, context)
+        pipeline.execute()
+        self.log.debug(
+            f'step=stage, event=kvstore-write, contexts={len(writes)}, '
+            f'variables={sum(len(m) for m in writes.values())}'
+        )
+
     def stage(
         self,
         variable: str,
@@ -56,12 +242,89 @@ class StagerKvstore:
         """Stage data in redis"""
         self.playbook.create.any(variable, data, when_requested=False)
 
-    def delete_context(self, context: str):
+    def delete_context(self, context: str) -> int:
         """Delete data in redis"""
-        keys = self.redis_client.hkeys(context)
-        if keys:
-            return self.redis_client.hdel(context, *keys)  # type: ignore
-        return 0
+        return kvstore_contexts.delete(self.redis_client, [context])
+
+    def _binary_source(self, data: str | None, variable: str, stack: ExitStack) -> Any:
+        """Return the bytes (or the memory mapped file) of base64 data or a "file:" reference."""
+        if data is None:
+            return None
+
+        if not data.startswith('file:'):
+            return self._decode_binary(data, variable) or b''
+
+        filename = Path(data.removeprefix('file:'))
+        if not filename.is_absolute():
+            filename = config_model.test_case_feature_dir / filename
+
+        try:
+            fh = stack.enter_context(filename.open('rb'))
+            if filename.stat().st_size == 0:
+                return b''
+            return stack.enter_context(mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ))
+        except OSError as ex:
+            Render.panel.failure(
+                f'The Binary staging file {filename} for variable {variable} '
+                f'could not be read ({ex}).'
+            )
+        return None  # pragma: no cover
+
+    def _encode_binary(
+        self, data: list[str | None], variable: str, array: bool = False
+    ) -> memoryview:
+        """Return the serialized value for base64 data or "file:" references.
+
+        The value (a JSON string, or an array of JSON strings for BinaryArray) is written to a
+        single preallocated buffer. Files are memory mapped and base64 encoded into the buffer
+        in chunks of encode_chunk_size bytes.
+        """
+        with ExitStack() as stack:
+            sources = [self._binary_source(d, variable, stack) for d in data]
+
+            # base64 characters do not need to be escaped in a JSON string
+            size = sum(4 if s is None else 2 + (len(s) + 2) // 3 * 4 for s in sources)
+            if array:
+                size += 2 + max(len(sources) - 1, 0)  # brackets and commas
+            buffer = bytearray(size)
+
+            offset = 0
+            if array:
+                buffer[0] = ord('[')
+                offset = 1
+            for index, source in enumerate(sources):
+                if index > 0:
+                    buffer[offset] = ord(',')
+                    offset += 1
+                if source is None:
+                    buffer[offset : offset + 4] = b'null'
+                    offset += 4
+                    continue
+
+                buffer[offset] = ord('"')
+                offset += 1
+                for start in range(0, len(source), self.encode_chunk_size):
+                    encoded = binascii.b2a_base64(
+                        source[start : start + self.encode_chunk_size], newline=False
+                    )
+                    buffer[offset : offset + len(encoded)] = encoded
+                    offset += len(encoded)
+                buffer[offset] = ord('"')
+                offset += 1
+            if array:
+                buffer[offset] = ord(']')
+
+        # redis accepts a memoryview, which does not copy the buffer
+        return memoryview(buffer)
+
+    @staticmethod
+    def _is_file_reference(data: Any, variable_type: str) -> bool:
+        """Return True if Binary staging data references a file (e.g., "file:data/image.png")."""
+        if variable_type == 'Binary':
+            return isinstance(data, str) and data.startswith('file:')
+        if variable_type == 'BinaryArray' and isinstance(data, list):
+            return any(isinstance(d, str) and d.startswith('file:') for d in data)
+        return False
 
     @staticmethod
     def _decode_binary(binary_data: bytes | None, variable: str) -> bytes | None:
@@ -1,43 +1,412 @@
 """TcEx Framework Module"""
 
 # standard library
+import json
 import logging
+import threading
+import time
+import uuid
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 
 # first-party
+from tcex_app_testing.cache import FileCache
+from tcex_app_testing.config_model import config_model
+from tcex_app_testing.pleb.cached_property import cached_property
+from tcex_app_testing.profile.variable_template import (
+    Variable,
+    VariableTemplate,
+    compile_expression,
+)
 from tcex_app_testing.render.render import Render
 from tcex_app_testing.requests_tc import TcSession
+from tcex_app_testing.stager.cleanup_journal import CleanupJournal
+from tcex_app_testing.stager.staged_registry import staged_registry
 
 _logger = logging.getLogger(__name__.split('.', maxsplit=1)[0])
 
+# the v3 fields that make up the indicator summary (value1-value3 for other types)
+INDICATOR_SUMMARY_FIELDS = {
+    'Address': ('ip',),
+    'EmailAddress': ('address',),
+    'File': ('md5', 'sha1', 'sha256'),
+    'Host': ('hostName',),
+    'URL': ('text',),
+}
+
+# the fields of each v3 type by API host, shared by all stager instances in the session
+_fields: dict[str, list[str]] = {}
+_fields_lock = threading.Lock()
+
 
 class StagerThreatconnect:
     """Stages the Redis Data"""
 
+    # the max number of concurrent requests to ThreatConnect (--tc_concurrent)
+    max_workers = 8
+
+    # the min number of indicators in a profile to use the batch API (TCEX_TEST_TC_BATCH=true)
+    batch_min_items = 10
+    batch_poll_interval = 1
+    batch_timeout = 300
+
     def __init__(self, session: TcSession):
         """Initialize class properties."""
         self.session = session
         self.log = _logger
 
-        # available fields for different types of tc endpoints
-        self.fields = {}
+        # stage items concurrently (--tc_concurrent), by default items are staged in order
+        self.concurrent = False
+
+        # available fields for different types of tc endpoints (by API host and type)
+        self.fields = _fields
+        self.journal = CleanupJournal()
+        self._journaled: set[tuple[str, str]] = set()
+
+    @staticmethod
+    def _dependencies(data: dict, items: dict[tuple[str, str], dict]) -> set[tuple[str, str]]:
+        """Return the staged items referenced by the data (e.g., ${tc.artifacts.myArtifact.id})."""
+        dependencies = set()
+        for variable in VariableTemplate(data).variables:
+            parts = variable.groups[0].split('.')
+            if parts[0] == 'tc' and tuple(parts[1:3]) in items:
+                dependencies.add((parts[1], parts[2]))
+        return dependencies
+
+    def _batch_indicator(self, data: dict) -> tuple[str, dict] | None:
+        """Return the owner and batch (v2) format of a v3 indicator, or None if not supported."""
+        indicator_type = data.get('type')
+        summary_fields = INDICATOR_SUMMARY_FIELDS.get(
+            indicator_type,  # type: ignore
+            ('value1', 'value2', 'value3'),
+        )
+        supported_fields = {'attributes', 'confidence', 'ownerName', 'rating', 'tags', 'type'}
+        if not indicator_type or not set(data).issubset(supported_fields | set(summary_fields)):
+            return None
+
+        summary = ' : '.join(str(data[f]) for f in summary_fields if data.get(f))
+        if not summary:
+            return None
+
+        entry = {
+            'type': indicator_type,
+            'summary': summary,
+            'xid': f'tcex-app-testing-{uuid.uuid4()}',
+        }
+        for field in ('confidence', 'rating'):
+            if field in data:
+                entry[field] = data[field]
+        for field, batch_field, keys in (
+            ('attributes', 'attribute', ('type', 'value')),
+            ('tags', 'tag', ('name',)),
+        ):
+            if field not in data:
+                continue
+            if not isinstance(data[field], dict) or set(data[field]) != {'data'}:
+                return None
+            entry[batch_field] = [{k: v.get(k) for k in keys} for v in data[field]['data']]
+        return data.get('ownerName') or self.owner, entry
+
+    def _bulk_items(
+        self, items: dict[tuple[str, str], dict], staged: set[tuple[str, str]]
+    ) -> dict[tuple[str, str], tuple]:
+        """Return the indicators that can be created with the batch API.
+
+        Args:
+            items: The items to stage.
+            staged: The items that are already staged (e.g., reused).
+        """
+        if not config_model.test_tc_batch:
+            return {}
+
+        bulk_items = {}
+        for key, data in items.items():
+            if key[0] != 'indicators' or key in staged or self._dependencies(data, items):
+                continue
+            batch_indicator = self._batch_indicator(data)
+            if batch_indicator is not None:
+                bulk_items[key] = batch_indicator
+
+        if len(bulk_items) < self.batch_min_items:
+            return {}
+        return bulk_items
+
+    def _lookup_indicators(self, owner: str, summaries: list[str]) -> dict[str, dict]:
+        """Return the indicators with the provided summaries by lower case summary."""
+        indicators = {}
+        chunk_size = 100
+        for i in range(0, len(summaries), chunk_size):
+            values = ', '.join(json.dumps(summary) for summary in summaries[i : i + chunk_size])
+            params = {
+                'fields': self.get_fields('indicators'),
+                'resultLimit': chunk_size * 3,
+                'tql': f'ownerName EQ {json.dumps(owner)} AND summary IN ({values})',
+            }
+            response = self.session.get('/v3/indicators', params=params)
+            if not response.ok:
+                self.log.error(
+                    f'step=setup, event=staging-batch-lookup, status={response.status_code}, '
+                    f'message={response.text}'
+                )
+                continue
+            for indicator in response.json().get('data', []):
+                indicators[str(indicator.get('summary', '')).lower()] = indicator
+        return indicators
+
+    @cached_property
+    def owner(self) -> str:
+        """Return the name of the default owner of the API user."""
+        response = self.session.get('/v2/owners/mine')
+        return response.json().get('data', {}).get('owner', {}).get('name')
+
+    def _pool_session(self, workers: int):
+        """Ensure the session connection pools can hold a connection for each worker.
+
+        The pool of the existing adapters is resized, so that the adapter configuration of the
+        session (e.g., retries) is kept.
+        """
+        for prefix in ['https://', 'http://']:
+            adapter = self.session.get_adapter(prefix)
+            if not hasattr(adapter, 'init_poolmanager'):
+                continue
+            if getattr(adapter, '_pool_maxsize', 0) >= workers:
+                continue
+
+            adapter.poolmanager.clear()  # type: ignore
+            adapter.init_poolmanager(  # type: ignore
+                getattr(adapter, '_pool_connections', 10),
+                workers,
+                block=getattr(adapter, '_pool_block', False),
+            )
+
+    def _resolve(self, data: dict, staged_data: dict) -> dict:
+        """Return the data with references to previously staged items replaced."""
+
+        def resolve(variable: Variable) -> str | None:
+            expression = variable.groups[0]
+            if not expression.startswith('tc.'):
+                return None
+            value = compile_expression(expression).search({'tc': staged_data})
+            return None if value is None else str(value)
+
+        return VariableTemplate(data).render(resolve)
+
+    def _waves(
+        self, items: dict[tuple[str, str], dict], staged: set[tuple[str, str]]
+    ) -> list[list[tuple[str, str]]]:
+        """Return the items grouped into waves, each wave only depends on previous waves.
+
+        Args:
+            items: The items to stage.
+            staged: The items that are already staged.
+        """
+        dependencies = {k: self._dependencies(v, items) - {k} for k, v in items.items()}
+
+        waves = []
+        staged = set(staged)
+        while len(staged) < len(items):
+            wave = [k for k, v in dependencies.items() if k not in staged and v <= staged]
+            if not wave:
+                pending = sorted(f'{k[0]}.{k[1]}' for k in items if k not in staged)
+                Render.panel.failure(
+                    f'Circular reference in staged ThreatConnect data: {", ".join(pending)}.'
+                )
+            waves.append(wave)
+            staged.update(wave)
+        return waves
 
     def stage(self, threatconnect_data) -> dict:
-        """Stage data in ThreatConnect."""
-        staged_data = {}
+        """Stage data in ThreatConnect.
+
+        Items are staged in the order of the profile. With --tc_concurrent, items are staged
+        concurrently and items that reference other staged items (e.g., a case with
+        "${tc.artifacts.myArtifact.id}") are staged after the items they reference (references
+        by other means, e.g., xid, are not detected). If any item fails to stage, the items
+        that were already created are removed.
+
+        With TCEX_TEST_TC_BATCH=true, profiles with at least batch_min_items indicators create
+        the indicators with the batch API and map the created indicators back by summary.
+        Indicators that already exist in ThreatConnect are staged individually.
+
+        With TCEX_TEST_TC_REUSE=true, items without references that are identical to items
+        staged by a previous profile reuse the existing object (the object must not be
+        modified by the App).
+        """
+        items = {}
         for root_key, root_value in threatconnect_data.items():
-            staged_data.setdefault(root_key, {})
             for key, data in root_value.items():
-                if key in staged_data:
+                if (root_key, key) in items:
                     ex_msg = f'ThreatConnect variable {key} is already staged.'
                     raise RuntimeError(ex_msg)
-                staged_data[root_key][f'{key}'] = self.stage_data(root_key, data)
+                items[(root_key, f'{key}')] = data
 
-        return staged_data
+        staged_data = {root_key: {} for root_key in threatconnect_data}
+        if not items:
+            return staged_data
+
+        # objects identical to objects staged by a previous profile are reused
+        reuse_keys = self._reuse_keys(items)
+        for (root_key, key), reuse_key in reuse_keys.items():
+            staged = staged_registry.acquire(reuse_key)
+            if staged is not None:
+                staged_data[root_key][key] = staged
+        reused = {k for k in reuse_keys if k[1] in staged_data[k[0]]}
+        self._journaled.update(self.journal.staged_entries(staged_data))
 
-    def stage_data(self, ioc_type, data):
-        """Stage data in ThreatConnect."""
         self.session.log_curl = True
+        workers = 1
+        if self.concurrent:
+            workers = min(self.max_workers, len(items))
+            self._pool_session(workers)
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='stager-tc') as executor:
+            # the fields for all types are retrieved before staging
+            list(executor.map(self.get_fields, threatconnect_data))
+
+            # indicators without dependencies are created with the batch API (bulk mode)
+            bulk_items = self._bulk_items(items, reused)
+            if bulk_items:
+                errors = self._stage_batch(bulk_items, staged_data)
+                self._journal(staged_data)
+                self._rollback_on_error(staged_data, errors)
+
+            # indicators that were not created by the batch job are staged individually
+            staged = reused | {k for k in bulk_items if k[1] in staged_data[k[0]]}
+            waves = (
+                self._waves(items, staged)
+                if self.concurrent
+                else [[k] for k in items if k not in staged]
+            )
+            for wave in waves:
+                wave_data = [
+                    (root_key, self._resolve(items[(root_key, key)], staged_data))
+                    for root_key, key in wave
+                ]
+                results = executor.map(lambda args: self._post(*args), wave_data)
+                errors = []
+                for (root_key, key), (staged, error) in zip(wave, results, strict=True):
+                    if error is None:
+                        staged_data[root_key][key] = staged
+                    else:
+                        errors.append(error)
+                self._journal(staged_data)
+                self._rollback_on_error(staged_data, errors)
+
+        for (root_key, key), reuse_key in reuse_keys.items():
+            if (root_key, key) not in reused:
+                staged_registry.register(reuse_key, root_key, staged_data[root_key][key])
+        return staged_data
+
+    def _journal(self, staged_data: dict):
+        """Add the staged data that is not in the cleanup journal yet."""
+        entries = [e for e in self.journal.staged_entries(staged_data) if e not in self._journaled]
+        self.journal.add(entries, self.journal.staged_owners(staged_data))
+        self._journaled.update(entries)
+
+    def _reuse_keys(self, items: dict[tuple[str, str], dict]) -> dict[tuple[str, str], str]:
+        """Return the content hash of the items that can be shared with other profiles.
+
+        Items that reference other staged items are not shared, since the referenced items
+        are different for each profile.
+        """
+        if not config_model.test_tc_reuse:
+            return {}
+
+        return {
+            k: staged_registry.key(k[0], v)
+            for k, v in items.items()
+            if not self._dependencies(v, items)
+        }
+
+    def _rollback_on_error(self, staged_data: dict, errors: list[str]):
+        """Remove the items that were already staged and report the errors."""
+        if not errors:
+            return
+
+        self.log.error(f'step=setup, event=staging-threatconnect-rollback, errors={len(errors)}')
+        self.cleanup(staged_data)
+        Render.panel.failure('\n\n'.join(errors))
+
+    def _stage_batch(self, bulk_items: dict[tuple[str, str], tuple], staged_data: dict) -> list:
+        """Create the indicators with the batch API and return any error messages.
 
+        Indicators that already exist in the owner are not added to the batch job (they would
+        be updated and then removed by the cleanup), and are staged individually instead.
+        """
+        errors = []
+        owners = defaultdict(dict)
+        for key, (owner, entry) in bulk_items.items():
+            owners[owner][key] = entry
+
+        for owner, owner_entries in owners.items():
+            existing = self._lookup_indicators(
+                owner, [e['summary'] for e in owner_entries.values()]
+            )
+            entries = {
+                k: e for k, e in owner_entries.items() if e['summary'].lower() not in existing
+            }
+            if len(entries) < len(owner_entries):
+                self.log.info(
+                    f'step=setup, event=staging-batch-existing, owner={owner}, '
+                    f'indicators={len(owner_entries) - len(entries)}'
+                )
+            if not entries:
+                continue
+
+            self.log.info(
+                f'step=setup, event=staging-batch, owner={owner}, indicators={len(entries)}'
+            )
+            error_msg = self._submit_batch(owner, list(entries.values()))
+            if error_msg is not None:
+                errors.append(error_msg)
+
+            # map the created indicators back to their keys (also after errors for the rollback)
+            indicators = self._lookup_indicators(owner, [e['summary'] for e in entries.values()])
+            for (root_key, key), entry in entries.items():
+                indicator = indicators.get(entry['summary'].lower())
+                if indicator is not None:
+                    staged_data[root_key][key] = indicator
+                elif error_msg is None:
+                    errors.append(f'Indicator {entry["summary"]} was not created by the batch job.')
+        return errors
+
+    def _submit_batch(self, owner: str, indicators: list[dict]) -> str | None:
+        """Submit a batch job and wait for it to complete, return the error message on failure."""
+        batch_config = {
+            'action': 'Create',
+            'attributeWriteType': 'Append',
+            'haltOnError': False,
+            'owner': owner,
+            'version': 'V2',
+        }
+        response = self.session.post(
+            '/v2/batch/v2',
+            files={
+                'config': json.dumps(batch_config),
+                'content': json.dumps({'indicator': indicators}),
+            },
+        )
+        if not response.ok:
+            return f'Error submitting batch job: {response.text} ({response.status_code}).'
+
+        batch_id = response.json().get('data', {}).get('batchId')
+        deadline = time.monotonic() + self.batch_timeout
+        while time.monotonic() < deadline:
+            response = self.session.get(f'/v2/batch/{batch_id}')
+            if not response.ok:
+                return f'Error polling batch job {batch_id}: {response.text}.'
+
+            batch_status = response.json().get('data', {}).get('batchStatus', {})
+            if batch_status.get('status') == 'Completed':
+                if batch_status.get('errorCount'):
+                    errors = self.session.get(f'/v2/batch/{batch_id}/errors').text
+                    return f'Batch job {batch_id} completed with errors: {errors}.'
+                return None
+            time.sleep(self.batch_poll_interval)
+        return f'Batch job {batch_id} did not complete within {self.batch_timeout} seconds.'
+
+    def _post(self, ioc_type: str, data: dict) -> tuple[dict, str | None]:
+        """Create the item and return the response data and error message (None on success)."""
         params = {'fields': self.get_fields(ioc_type)}
         response = self.session.post(f'/v3/{ioc_type}', json=data, params=params)
         if not response.ok:
@@ -51,30 +420,52 @@ class StagerThreatconnect:
 
             error_msg = '\n'.join(error_msg)
             self.log.error(f'step=setup, event=staging-{ioc_type}-data, message={error_msg}')
-            Render.panel.failure(error_msg)
+            return {}, error_msg
 
         response_json = response.json()
-        return response_json.get('data', response_json)
+        return response_json.get('data', response_json), None
+
+    @cached_property
+    def fields_cache(self) -> FileCache:
+        """Return the disk cache for the fields of each type."""
+        return FileCache('tc_fields', ttl=config_model.test_fields_ttl)
 
     def get_fields(self, type_):
-        """Return fields for the provided type."""
-        fields = self.fields.get(type_.lower(), [])
+        """Return fields for the provided type.
+
+        The fields are cached in memory for the session and on disk (TCEX_TEST_FIELDS_TTL).
+        """
+        cache_key = f'{config_model.tc_api_path}|{type_.lower()}'
+        fields = self.fields.get(cache_key, [])
         if fields:
             return fields
-        response = self.session.options(f'/v3/{type_}/fields', params={})
-        fields = [field.get('name') for field in response.json().get('data', [])]
-        self.fields[type_.lower()] = fields
+
+        fields = self.fields_cache.get(cache_key)
+        if not fields:
+            response = self.session.options(f'/v3/{type_}/fields', params={})
+            fields = [field.get('name') for field in response.json().get('data', [])]
+            if response.ok and fields:
+                self.fields_cache.set(cache_key, fields)
+
+        with _fields_lock:
+            self.fields[cache_key] = fields
         return fields
 
     def cleanup(self, staged_data: dict):
-        """Cleanup staged data in ThreatConnect."""
-        for root_key, root_value in staged_data.items():
-            for data in root_value.values():
-                response = self.session.delete(f'/v3/{root_key}/{data.get("id")}')
-                if not response.ok:
-                    Render.panel.error(f'Failed to cleanup data {data} in ThreatConnect.')
-                    self.log.error(
-                        f'step=cleanup, '
-                        f'event=cleanup-{root_key}-data, '
-                        f'message=Failed to cleanup data {data} in ThreatConnect.'
-                    )
+        """Cleanup staged data in ThreatConnect.
+
+        The data is deleted concurrently (with retries). Data that could not be deleted and
+        objects shared with other profiles (TCEX_TEST_TC_REUSE=true) stay in the cleanup
+        journal and are deleted when the journal is drained.
+        """
+        # shared objects are released, they are deleted when the journal is drained
+        entries = [
+            e for e in self.journal.staged_entries(staged_data) if not staged_registry.release(*e)
+        ]
+        for root_key, id_ in self.journal.delete(self.session, entries):
+            Render.panel.error(f'Failed to cleanup data {root_key}/{id_} in ThreatConnect.')
+            self.log.error(
+                f'step=cleanup, '
+                f'event=cleanup-{root_key}-data, '
+                f'message=Failed to cleanup data {root_key}/{id_} in ThreatConnect.'
+            )
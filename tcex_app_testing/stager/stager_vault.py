@@ -9,6 +9,8 @@ import hvac
 from hvac.exceptions import InvalidPath, VaultError
 
 # first-party
+from tcex_app_testing.cache import vault_cache
+from tcex_app_testing.env_store import EnvStore
 from tcex_app_testing.pleb.cached_property import cached_property
 from tcex_app_testing.render.render import Render
 
@@ -60,18 +62,16 @@ class StagerVault:
         Args:
             url: The url to the vault data including the key (e.g. myData/mySecret).
         """
-        url = url.lstrip('/')
-        if not url.startswith(self._vault_base_path):
-            url = f'{self._vault_base_path}/{url}'
-        url_ = url.split('/')
+        mount_point, url = self.secret_path(url)
 
-        # the mount point from the path
-        # (e.g., "/myData/myResource/token/" -> "myData")
-        mount_point = url_[0]
-
-        # the path with the key and mount point removed
-        # (e.g., "/myData/myResource/token/" -> "myResource")
-        url = '/'.join(url_[1:])
+        # secrets read by EnvStore (e.g., prefetched at collection time) or the Vault cache.
+        # empty secrets (e.g., a path that was not found) are read again, so that an invalid
+        # path fails the test
+        cached_data = EnvStore().secret_cache.get((mount_point, url)) or vault_cache.get(
+            mount_point, url
+        )
+        if cached_data:
+            return cached_data
 
         data = {}
         try:
@@ -90,7 +90,29 @@ class StagerVault:
             self.log.exception(f'step=setup, event=env-store-generic-failure, path={url}')
             Render.panel.failure(f'Error reading from Vault for path {url}: {e}.')
 
-        return data.get('data', data).get('data', data)
+        data = data.get('data', data).get('data', data)
+        if isinstance(data, dict):
+            vault_cache.set(mount_point, url, data)
+        return data
+
+    def secret_path(self, url: str) -> tuple[str, str]:
+        """Return the mount point and path for the provided url.
+
+        Args:
+            url: The url to the vault data (e.g. myData/mySecret).
+        """
+        url = url.lstrip('/')
+        if not url.startswith(self._vault_base_path):
+            url = f'{self._vault_base_path}/{url}'
+        url_ = url.split('/')
+
+        # the mount point from the path
+        # (e.g., "/myData/myResource/token/" -> "myData")
+        mount_point = url_[0]
+
+        # the path with the key and mount point removed
+        # (e.g., "/myData/myResource/token/" -> "myResource")
+        return mount_point, '/'.join(url_[1:])
 
     @cached_property
     def _vault_base_path(self):
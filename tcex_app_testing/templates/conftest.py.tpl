@@ -11,9 +11,13 @@ from pathlib import Path
 from threading import Thread
 
 # third-party
+import pytest
 from _pytest.config import Config
 from _pytest.config.argparsing import Parser
+from _pytest.main import Session
+from _pytest.nodes import Collector, Item
 from _pytest.python import Metafunc
+from _pytest.terminal import TerminalReporter
 from dotenv import load_dotenv
 from fakeredis import TcpFakeServer
 
@@ -101,6 +105,41 @@ def pytest_addoption(parser: Parser):
     parser.addoption('--replace_exit_message', action='store_true')
     parser.addoption('--replace_outputs', action='store_true')
     parser.addoption('--record', action='store_true')
+    parser.addoption(
+        '--result_cache',
+        action='store_true',
+        help='Skip profiles that are unchanged since their last passing run.',
+    )
+    parser.addoption(
+        '--result_cache_force',
+        action='store_true',
+        help='Run all profiles and refresh the result cache (requires --result_cache).',
+    )
+    parser.addoption(
+        '--schedule_by_duration',
+        action='store_true',
+        help='Run the slowest profiles (from previous runs) first when using pytest-xdist.',
+    )
+    parser.addoption(
+        '--leak_check',
+        action='store_true',
+        help='Report memory retained between profiles (tracemalloc and gc object counts).',
+    )
+    parser.addoption(
+        '--defer_cleanup',
+        action='store_true',
+        help='Delete staged ThreatConnect data at the end of the session instead of per profile.',
+    )
+    parser.addoption(
+        '--tc_concurrent',
+        action='store_true',
+        help='Stage ThreatConnect data concurrently (items are ordered by ${tc.*} references).',
+    )
+    parser.addoption(
+        '--skip_prefetch',
+        action='store_true',
+        help='Do not resolve env variables and Vault secrets of all profiles at collection.',
+    )
     parser.addoption(
         '--environment',
         action='append',
@@ -127,11 +166,61 @@ def pytest_generate_tests(metafunc: Metafunc):
     metafunc.parametrize('profile_name,', profiles(profile_dir))
 
 
+def pytest_collectstart(collector: Collector):
+    """Warm the env store and Vault caches for the profiles of a feature during collection."""
+    if not isinstance(collector, pytest.Module) or collector.path.name != 'test_profiles.py':
+        return
+
+    config = collector.config
+    if config.getoption('skip_prefetch'):
+        return
+
+    if os.getenv('PYTEST_XDIST_WORKER') is None and getattr(config.option, 'dist', 'no') != 'no':
+        # the controller process does not run tests
+        return
+
+    # first-party
+    from tcex_app_testing.profile.profile_prefetch import ProfilePrefetch  # noqa: PLC0415
+
+    ProfilePrefetch(collector.path.parent / 'profiles.d', config.getoption('environment')).start()
+
+
 def pytest_configure(config: Config):  # pylint: disable=unused-argument
     """Execute configure logic before test is started."""
     config.tcp_fake_server = None  # type: ignore
+
+    # record test durations and order profiles by duration (--schedule_by_duration)
+    # first-party
+    from tcex_app_testing.metrics.duration_scheduler import DurationScheduler  # noqa: PLC0415
+
+    config.pluginmanager.register(
+        DurationScheduler(config, config.getoption('schedule_by_duration')),
+        'tcex_duration_scheduler',
+    )
     server_address = 'localhost'
-    server_port = 6379
+    server_port = int(os.getenv('TC_KVSTORE_PORT', '6379'))
+
+    # when running with pytest-xdist (e.g., pytest -n auto) each worker is its own process
+    worker_id = os.getenv('PYTEST_XDIST_WORKER')
+    if worker_id is None and getattr(config.option, 'dist', 'no') != 'no':
+        # the controller process does not run tests, each worker starts its own fake server
+        return
+
+    if worker_id is not None:
+        # each worker writes to its own log file (e.g., log/tests-gw0.log)
+        log_file = config.getoption('log_file', None) or config.getini('log_file')
+        if log_file:
+            log_file_path = Path(log_file)
+            config.option.log_file = str(
+                log_file_path.with_name(f'{log_file_path.stem}-{worker_id}{log_file_path.suffix}')
+            )
+
+    config.leak_check = None  # type: ignore
+    if config.getoption('leak_check'):
+        # first-party
+        from tcex_app_testing.metrics.leak_check import LeakCheck  # noqa: PLC0415
+
+        config.leak_check = LeakCheck()  # type: ignore
 
     def is_port_in_use() -> bool:
         """Check if a port is in use."""
@@ -139,13 +228,73 @@ def pytest_configure(config: Config):  # pylint: disable=unused-argument
             return s.connect_ex((server_address, server_port)) == 0
 
     if not is_port_in_use():
+        if worker_id is not None:
+            # use a port assigned by the OS so that workers do not collide
+            server_port = 0
+
         tcp_fake_server = TcpFakeServer((server_address, server_port), server_type='redis')
         tcp_fake_server.daemon_threads = True
         t = Thread(target=tcp_fake_server.serve_forever, daemon=True)
         t.start()
         config.tcp_fake_server = tcp_fake_server  # type: ignore
 
-        print('Starting fake Redis server.')  # noqa: T201
+        # update the KV store port for the test framework and the App
+        server_port = tcp_fake_server.server_address[1]
+        os.environ['TC_KVSTORE_PORT'] = str(server_port)
+        if 'tcex_app_testing.config_model' in sys.modules:
+            sys.modules['tcex_app_testing.config_model'].config_model.tc_kvstore_port = server_port
+
+        print(f'Starting fake Redis server on port {server_port}.')  # noqa: T201
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item: Item, nextitem: Item | None):  # noqa: ARG001
+    """Take memory snapshots before and after each test when --leak_check is enabled."""
+    leak_check = getattr(item.config, 'leak_check', None)
+    if leak_check is None:
+        yield
+        return
+
+    leak_check.start()
+    yield
+    leak_check.stop(item.nodeid)
+
+
+def pytest_sessionstart(session: Session):
+    """Delete the kv store contexts of previous sessions that have expired."""
+    config = session.config
+    if os.getenv('PYTEST_XDIST_WORKER') is None and getattr(config.option, 'dist', 'no') != 'no':
+        # the controller process does not run tests
+        return
+
+    # first-party
+    from tcex_app_testing.stager.kvstore_contexts import kvstore_contexts  # noqa: PLC0415
+
+    kvstore_contexts.purge(expired=True)
+
+
+def pytest_sessionfinish(session: Session):
+    """Delete the kv store contexts of the session and the staged ThreatConnect data."""
+    # first-party
+    from tcex_app_testing.stager.cleanup_journal import CleanupJournal  # noqa: PLC0415
+
+    config = session.config
+    worker_id = os.getenv('PYTEST_XDIST_WORKER')
+    if worker_id is None and getattr(config.option, 'dist', 'no') != 'no':
+        # the controller process does not run tests (no kv store contexts), it drains the
+        # journal after all workers have finished
+        config.cleanup_summary = CleanupJournal().drain()  # type: ignore
+        return
+
+    # first-party
+    from tcex_app_testing.stager.kvstore_contexts import kvstore_contexts  # noqa: PLC0415
+
+    # each process that runs tests deletes the contexts it created
+    kvstore_contexts.purge()
+
+    if worker_id is None:
+        # without xdist, the single process drains the journal
+        config.cleanup_summary = CleanupJournal().drain()  # type: ignore
 
 
 def pytest_unconfigure(config: Config):  # pylint: disable=unused-argument
@@ -153,6 +302,11 @@ def pytest_unconfigure(config: Config):  # pylint: disable=unused-argument
     if config.tcp_fake_server:  # type: ignore
         config.tcp_fake_server.server_close()  # type: ignore
         config.tcp_fake_server.shutdown()  # type: ignore
+
+    # log cleanup and reporting is handled by the controller process, after all workers finish
+    if os.getenv('PYTEST_XDIST_WORKER') is not None:
+        return
+
     log_directory = Path.cwd() / 'log'
 
     # remove any 0 byte files from log directory
@@ -163,16 +317,17 @@ def pytest_unconfigure(config: Config):  # pylint: disable=unused-argument
         except OSError:
             continue
 
-    # display any Errors or Warnings in tests.log
-    test_log_file = log_directory / 'tests.log'
+    # display any Errors or Warnings in tests.log (and tests-<worker>.log for parallel runs)
+    test_log_files = sorted(log_directory.glob('tests*.log'))
     errors_count = {'ERROR': 0, 'WARNING': 0}
-    if test_log_file.is_file():
+    for test_log_file in test_log_files:
         with test_log_file.open(encoding='utf-8') as fh:
             for line in fh:
                 if '- ERROR - ' in line:
                     errors_count['ERROR'] += 1
                 elif '- WARNING - ' in line:
                     errors_count['WARNING'] += 1
+    if test_log_files:
         print(f'Error/Warning Count: {errors_count}')  # noqa: T201
         if any((errors_count['ERROR'], errors_count['WARNING'])):
             print('Please check your log/tests.log file')  # noqa: T201
@@ -182,4 +337,39 @@ def pytest_unconfigure(config: Config):  # pylint: disable=unused-argument
         Path('./SERVICE_STARTED').unlink()
 
 
-clear_log_directory()
+def pytest_terminal_summary(terminalreporter: TerminalReporter):
+    """Display the slowest profile phases (staging, run, validation, etc) of the session."""
+    if os.getenv('PYTEST_XDIST_WORKER') is not None:
+        return
+
+    # first-party
+    from tcex_app_testing.metrics.phase_timer import PhaseTimer  # noqa: PLC0415
+
+    summary = PhaseTimer.summary()
+    if summary:
+        terminalreporter.write_sep('=', 'profile phase timings (log/timings*.jsonl)')
+        for line in summary:
+            terminalreporter.write_line(line)
+
+    cleanup_summary = getattr(terminalreporter.config, 'cleanup_summary', None)
+    if cleanup_summary:
+        terminalreporter.write_sep('=', 'threatconnect cleanup')
+        terminalreporter.write_line(
+            f'deleted: {cleanup_summary["deleted"]}, failed: {cleanup_summary["failed"]}'
+            + (' (retried at the end of the next session)' if cleanup_summary['failed'] else '')
+        )
+
+    if terminalreporter.config.getoption('leak_check'):
+        # first-party
+        from tcex_app_testing.metrics.leak_check import LeakCheck  # noqa: PLC0415
+
+        summary = LeakCheck.summary()
+        if summary:
+            terminalreporter.write_sep('=', 'leak check (log/leak_check*.jsonl)')
+            for line in summary:
+                terminalreporter.write_line(line)
+
+
+# pytest-xdist workers import this module after the controller has cleared the log directory
+if os.getenv('PYTEST_XDIST_WORKER') is None:
+    clear_log_directory()
@@ -14,9 +14,12 @@ class Custom:
 
     def setup_class(self, test_feature: TestCasePlaybook):
         """Run setup class code."""
-        # set the App run method (inline (default), subprocess)
+        # set the App run method (inline (default), fork, pool, subprocess)
         # Note: using inline forces the App to use the tcex version
-        # from site-packages and not the lib_ directory.
+        # from site-packages and not the lib_ directory. fork runs each
+        # profile in a forked copy of the test process (Linux/macOS only).
+        # pool reuses persistent App processes, which are recycled based
+        # on pool_max_runs and pool_max_rss (MB).
         # test_feature.run_method = 'inline'
 
     def setup_method(self, test_feature: TestCasePlaybook):
@@ -30,8 +33,8 @@ class Custom:
 
     def test_pre_run(self, test_feature: TestCasePlaybook, profile_data: dict, monkeypatch: MonkeyPatch):
         """Run test method code before App run method."""
-        if test_feature.run_method != 'inline':
-            test_feature.log.warning('run_method is not inline, monkeypatch will not work!')
+        if test_feature.run_method not in ['fork', 'inline']:
+            test_feature.log.warning('run_method is not inline or fork, monkeypatch will not work!')
 
     def test_pre_validate(self, test_feature: TestCasePlaybook, profile_data: dict):
         """Run test method code before test validation."""
@@ -38,7 +38,8 @@ class CustomFeature(Custom):
         Args:
             test_feature: test_feature object for this test run.
             profile_data: Data loaded from the test profile json file.
-            monkeypatch: if run_method is 'inline', then a monkeypatch object, else None
+            monkeypatch: if run_method is 'inline' or 'fork', then a monkeypatch object,
+                else None
         """
         super().test_pre_run(test_feature, profile_data, monkeypatch)
 
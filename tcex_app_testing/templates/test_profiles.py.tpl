@@ -6,6 +6,7 @@ import warnings
 
 # third-party
 import pytest
+from tcex_app_testing.metrics import phase_timer
 from tcex_app_testing.test_case import ${class_name}
 from _pytest.config import Config
 from _pytest.monkeypatch import MonkeyPatch
@@ -71,10 +72,16 @@ class TestProfiles(${class_name}):
             pytestconfig=pytestconfig,
         )
 
+        # the profile passed in a previous run with the same inputs (--result_cache)
+        if self.aux.result_cache_hit:
+            pytest.skip('result cache hit: unchanged since last passing run')
+
         try:
             # run custom test method before run method
             self.custom.test_pre_run(
-                self, self.aux.profile_runner.data, monkeypatch if self.run_method == 'inline' else None
+                self,
+                self.aux.profile_runner.data,
+                monkeypatch if self.run_method in ['fork', 'inline'] else None,
             )
 
             assert self.run_profile() in self.aux.profile_runner.model.exit_codes
@@ -95,18 +102,22 @@ class TestProfiles(${class_name}):
                 warnings.warn(msg)
                 pytest.xfail(msg)
             else:
-                validation.validate_outputs(
-                    self.aux.profile_runner.tc_playbook_out_variables,
-                    self.aux.profile_runner.model.outputs,
-                )
+                with phase_timer.phase('validate'):
+                    validation.validate_outputs(
+                        self.aux.profile_runner.tc_playbook_out_variables,
+                        self.aux.profile_runner.model.outputs,
+                    )
 
-                # validate App outputs with Profile outputs
-                validation.validate(self.aux.profile_runner.model.outputs)
+                    # validate App outputs with Profile outputs
+                    validation.validate(self.aux.profile_runner.model.outputs)
 
                 # validate exit message
                 if self.aux.profile_runner.model.exit_message:
                     self.aux.validate_exit_message(self.aux.profile_runner.model.exit_message)
 
+                # record the passing run for the result cache (--result_cache)
+                self.aux.result_cache_record()
+
         finally:
             # cleanup staged data
             self.aux.cleanup()
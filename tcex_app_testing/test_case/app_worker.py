@@ -0,0 +1,121 @@
+"""TcEx Framework Module
+
+App worker process for the "pool" run method of TestCasePlaybook.
+
+This module is executed as a script (python app_worker.py) from the App directory and must only
+import from the standard library, so that the App and its dependencies are loaded exactly as they
+would be with "python run.py".
+
+Protocol (JSON lines):
+    parent -> worker: {"env": {"TC_APP_PARAM_FILE": "...", ...}} (the parent environment)
+    worker -> parent: {"exit_code": 0, "pid": 1234, "rss": 123456}
+"""
+
+# standard library
+import json
+import os
+import sys
+import traceback
+from pathlib import Path
+
+# tcex caches that have to be reset between App executions in the same interpreter
+TCEX_RESETTABLE = [
+    ('tcex.pleb.cached_property', 'cached_property'),
+    ('tcex.pleb.scoped_property', 'scoped_property'),
+    ('tcex.registry', 'registry'),
+]
+
+
+def max_rss() -> int:
+    """Return the peak resident set size of the worker in KB."""
+    try:
+        # standard library
+        import resource  # noqa: PLC0415
+    except ImportError:  # pragma: no cover (windows)
+        return 0
+
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == 'darwin':
+        # macOS reports bytes instead of KB
+        rss //= 1024
+    return rss
+
+
+def reset_tcex():
+    """Reset tcex caches between App executions."""
+    for module_name, attribute in TCEX_RESETTABLE:
+        if module_name in sys.modules:
+            getattr(sys.modules[module_name], attribute)._reset()  # noqa: SLF001
+
+
+def run_app(env: dict[str, str]) -> int:
+    """Run the App with the provided environment and return the exit code."""
+    # replace the environment with the one of the parent, including removed variables
+    for key in set(os.environ) - set(env):
+        os.environ.pop(key)
+    os.environ.update(env)
+
+    # clear sys.argv
+    sys.argv = sys.argv[:1]
+
+    reset_tcex()
+
+    exit_code = 0
+    try:
+        # third-party
+        from run import Run  # type: ignore # noqa: PLC0415
+
+        run = Run()
+        run.setup()
+        run.launch()
+        run.teardown()
+    except SystemExit as e:
+        # e.code is None for sys.exit() and a str for sys.exit('message')
+        exit_code = e.code if isinstance(e.code, int) else int(e.code is not None)
+    except Exception:
+        traceback.print_exc()
+        exit_code = 1
+    return exit_code
+
+
+def update_path():
+    """Update sys.path so the App and the deps directory are found first."""
+    # when run as a script the first entry is the directory of this file
+    sys.path[0] = str(Path.cwd())
+
+    deps_dir = Path.cwd() / 'deps'
+    if deps_dir.is_dir():
+        sys.path.insert(0, str(deps_dir))
+
+
+def main():
+    """Process run requests from the parent process until stdin is closed."""
+    # keep the protocol on the original stdout and send anything the App prints to stderr
+    protocol_out = os.fdopen(os.dup(sys.stdout.fileno()), 'w', encoding='utf-8')
+    os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+
+    update_path()
+
+    # pre-warm the worker by importing the App while it waits for the first request
+    try:
+        # third-party
+        import run  # type: ignore # noqa: F401, PLC0415
+    except Exception:
+        traceback.print_exc()
+
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+
+        request = json.loads(line)
+        exit_code = run_app(request.get('env', {}))
+
+        protocol_out.write(
+            json.dumps({'exit_code': exit_code, 'pid': os.getpid(), 'rss': max_rss()})
+        )
+        protocol_out.write('\n')
+        protocol_out.flush()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,149 @@
+"""TcEx Framework Module"""
+
+# standard library
+import atexit
+import json
+import logging
+import subprocess  # nosec
+import sys
+from pathlib import Path
+
+# get logger
+_logger = logging.getLogger(__name__.split('.', maxsplit=1)[0])
+
+
+class AppWorker:
+    """A persistent App interpreter that runs one profile at a time.
+
+    The worker is started with app_worker.py and communicates with the parent over its
+    stdin/stdout pipes. The App is imported when the worker starts, so that the import
+    cost is paid while the previous profile is still being validated.
+    """
+
+    def __init__(self):
+        """Initialize instance properties."""
+        self.log = _logger
+        self.process = subprocess.Popen(  # nosec
+            [sys.executable, str(Path(__file__).with_name('app_worker.py'))],
+            bufsize=1,
+            encoding='utf-8',
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+        )
+
+        # properties
+        self.rss = 0
+        self.runs = 0
+
+        self.log.info(f'step=run, event=pool-worker-started, pid={self.pid}')
+
+    @property
+    def alive(self) -> bool:
+        """Return True if the worker process is still running."""
+        return self.process.poll() is None
+
+    @property
+    def pid(self) -> int:
+        """Return the worker process id."""
+        return self.process.pid
+
+    def run(self, env: dict[str, str]) -> int:
+        """Run the App in the worker and return the exit code."""
+        if self.process.stdin is None or self.process.stdout is None:
+            ex_msg = 'Worker process pipes are not available.'
+            raise RuntimeError(ex_msg)
+
+        self.runs += 1
+        try:
+            self.process.stdin.write(json.dumps({'env': env}))
+            self.process.stdin.write('\n')
+            self.process.stdin.flush()
+            response = self.process.stdout.readline()
+        except OSError:
+            response = ''
+
+        if not response:
+            # the worker exited while running the App (e.g., os._exit or a crash)
+            exit_code = self.process.wait()
+            self.log.error(
+                f'step=run, event=pool-worker-exited, pid={self.pid}, exit-code={exit_code}'
+            )
+            return exit_code
+
+        result = json.loads(response)
+        self.rss = result.get('rss', 0)
+        self.log.info(
+            f'step=run, event=pool-worker-run, pid={self.pid}, runs={self.runs}, '
+            f'rss-kb={self.rss}, exit-code={result.get("exit_code")}'
+        )
+        return result.get('exit_code', 1)
+
+    def stop(self, timeout: int = 10):
+        """Stop the worker process."""
+        if self.alive:
+            if self.process.stdin is not None:
+                self.process.stdin.close()
+            try:
+                self.process.wait(timeout=timeout)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+                self.process.wait()
+        self.log.info(
+            f'step=run, event=pool-worker-stopped, pid={self.pid}, runs={self.runs}, '
+            f'rss-kb={self.rss}'
+        )
+
+
+class AppWorkerPool:
+    """Pre-spawned App interpreter for running profiles.
+
+    Profiles run one at a time in a test process, so a single worker is kept warm. When it
+    is recycled a replacement is started right away, so that it imports the App while the
+    next profile is staged. With pytest-xdist, each test process has its own worker.
+
+    Args:
+        max_runs: The number of profiles a worker runs before it is recycled.
+        max_rss: The peak RSS (in MB) at which a worker is recycled.
+    """
+
+    def __init__(self, max_runs: int = 25, max_rss: int = 1024):
+        """Initialize instance properties."""
+        self.max_rss = max_rss
+        self.max_runs = max_runs
+
+        # properties
+        self.log = _logger
+
+        # pre-spawn the worker so it imports the App while the first profile is staged
+        self.worker: AppWorker | None = AppWorker()
+
+        # ensure the worker does not outlive the test session
+        atexit.register(self.close)
+
+    def _recycle(self, worker: AppWorker) -> bool:
+        """Return True if the worker should be replaced."""
+        return not worker.alive or worker.runs >= self.max_runs or worker.rss >= self.max_rss * 1024
+
+    def close(self):
+        """Stop the worker."""
+        if self.worker is not None:
+            self.worker.stop()
+            self.worker = None
+
+    def run(self, env: dict[str, str]) -> int:
+        """Run the App in the worker and return the exit code."""
+        worker = self.worker or AppWorker()
+
+        exit_code = worker.run(env)
+
+        if self._recycle(worker):
+            self.log.info(
+                f'step=run, event=pool-worker-recycle, pid={worker.pid}, runs={worker.runs}, '
+                f'rss-kb={worker.rss}, max-runs={self.max_runs}, max-rss-mb={self.max_rss}'
+            )
+            worker.stop()
+
+            # replace the recycled worker now so the next profile gets a warm interpreter
+            worker = AppWorker()
+        self.worker = worker
+        return exit_code
@@ -5,7 +5,6 @@ import json
 import logging
 import os
 import random
-import re
 import string
 import time
 from pathlib import Path
@@ -13,7 +12,6 @@ from typing import Any
 from uuid import uuid4
 
 # third-party
-import jmespath
 import pytest
 import urllib3
 from _pytest.config import Config
@@ -23,13 +21,20 @@ from _pytest.monkeypatch import MonkeyPatch
 from tcex_app_testing.app.app import App
 from tcex_app_testing.app.config.install_json import InstallJson
 from tcex_app_testing.app.playbook import Playbook
+from tcex_app_testing.cache import ResultCache, TokenCache
 from tcex_app_testing.config_model import config_model
 from tcex_app_testing.input.model.module_app_model import ModuleAppModel
 from tcex_app_testing.input.model.module_requests_session_model import ModuleRequestsSessionModel
+from tcex_app_testing.metrics import phase_timer
 from tcex_app_testing.pleb.cached_property import cached_property
 from tcex_app_testing.pleb.proxies import proxies
-from tcex_app_testing.profile.model.profile_model import ExitMessageModel
+from tcex_app_testing.profile.model.profile_model import ExitMessageModel, ProfileModel
 from tcex_app_testing.profile.profile_runner import ProfileRunner
+from tcex_app_testing.profile.variable_template import (
+    Variable,
+    VariableTemplate,
+    compile_expression,
+)
 from tcex_app_testing.registry import registry
 from tcex_app_testing.render.render import Render
 from tcex_app_testing.requests_tc import RequestsTc, TcSession
@@ -48,6 +53,9 @@ _logger = logging.getLogger(__name__.split('.', maxsplit=1)[0])
 class Aux:
     """Base TestCase Class"""
 
+    # set once tcex has been confirmed to build its Input with the inline config
+    inline_config_applied = False
+
     def __init__(self):
         """Initialize class properties."""
 
@@ -85,6 +93,15 @@ class Aux:
 
         self.recorded_data = {}
 
+        # the result cache key of the current profile (None when the result cache is disabled)
+        self.defer_cleanup = False
+        self.result_cache_hit = False
+        self.result_cache_key: str | None = None
+        self.tc_concurrent = False
+
+        # the compiled profile used to replace staged data variables
+        self._variable_template: tuple[ProfileModel, VariableTemplate, dict] | None = None
+
         # add methods to registry
         registry.add_service(App, self.app)
         registry.add_service(RequestsTc, self.session)
@@ -118,7 +135,14 @@ class Aux:
     @property
     def _get_tc_playbook_kvstore_context(self) -> str:
         """Generate a unique kv store context for each test case."""
-        return os.getenv('TC_PLAYBOOK_DB_CONTEXT', str(uuid4()))
+        context = os.getenv('TC_PLAYBOOK_DB_CONTEXT')
+        if context is None:
+            return str(uuid4())
+
+        # namespace a static context by xdist worker so parallel workers do not share data
+        if config_model.test_worker_id is not None:
+            context = f'{context}-{config_model.test_worker_id}'
+        return context
 
     @property
     def _user_agent(self) -> dict[str, str]:
@@ -137,12 +161,16 @@ class Aux:
 
         # using a developer token from the UI is still valid. however,
         # these token expire after a certain amount of time.
-        token = os.getenv('TC_TOKEN', self.tc_token)
+        token = os.getenv('TC_TOKEN')
+        token_expires = int(time.time()) + 3600
+        if token is None:
+            token = self.tc_token
+            token_expires = self.tc_token_expires
 
         # if a token is available, use token over HMAC auth
         if token is not None:
             _inputs['tc_token'] = token
-            _inputs['tc_token_expires'] = int(time.time()) + 3600
+            _inputs['tc_token_expires'] = token_expires
             del _inputs['tc_api_access_id']
             del _inputs['tc_api_secret_key']
 
@@ -191,6 +219,42 @@ class Aux:
         os.environ['TC_APP_PARAM_KEY'] = key
         os.environ['TC_APP_PARAM_FILE'] = str(app_params_json)
 
+    def create_config_inline(self, inputs: dict[str, Any]) -> bool:
+        """Provide the config directly to tcex for Apps that run in the test process.
+
+        The tcex Input class is patched (for the current test only) to use the resolved
+        config, which skips encrypting and writing the params file used by create_config
+        once the patch has been confirmed to apply (see inline_config_applied). Returns
+        False if tcex could not be imported and the params file is required.
+        """
+        try:
+            # third-party
+            from tcex.input.input import Input  # type: ignore # noqa: PLC0415
+        except ImportError:
+            return False
+
+        config = self.create_config_update(inputs)
+
+        # safely log all inputs to tests.log
+        self._log_inputs(config)
+
+        # ensure that the in directory exists
+        Path(config['tc_in_path']).mkdir(parents=True, exist_ok=True)
+
+        # normalize the config the same way as the params file (e.g., tuples to lists)
+        config = json.loads(json.dumps(config, sort_keys=True))
+
+        input_init = Input.__init__
+
+        def _init(self, config_: dict | None = None, config_file: str | None = None):
+            # tcex passes an empty dict when no config is provided (e.g., Input({}, None))
+            Aux.inline_config_applied = True
+            input_init(self, {**config, **(config_ or {})}, config_file)
+
+        self.profile_runner.monkeypatch.setattr(Input, '__init__', _init)
+        self.log.info('step=run, event=create-config, method=inline')
+        return True
+
     def create_config_update(
         self, app_inputs: dict[str, int | list | str | None]
     ) -> dict[str, Any]:
@@ -224,6 +288,18 @@ class Aux:
         """Stages and sets up the profile given a profile name"""
 
         self.log.info(f'step=run, event=init-profile, profile={profile_name}')
+        phase_timer.start(profile_name)
+
+        # leave staged ThreatConnect data in the cleanup journal until the session ends
+        self.defer_cleanup = bool(getattr(pytestconfig.option, 'defer_cleanup', False))
+
+        # stage ThreatConnect data concurrently (ordered by variable references)
+        self.tc_concurrent = bool(getattr(pytestconfig.option, 'tc_concurrent', False))
+
+        # skip profiles that are unchanged since the last passing run
+        self.result_cache_check(pytestconfig)
+        if self.result_cache_hit:
+            return
         self._profile_runner = ProfileRunner(
             app_inputs=app_inputs,
             monkeypatch=monkeypatch,
@@ -252,26 +328,89 @@ class Aux:
         # stage kvstore data based on current profile
         self.stage_data()
 
+    @cached_property
+    def result_cache(self) -> ResultCache:
+        """Return the result cache."""
+        return ResultCache(config_model.app_path)
+
+    def result_cache_check(self, pytestconfig: Config | None):
+        """Check if the current profile passed previously with the same inputs.
+
+        The result cache is enabled with --result_cache and is bypassed with
+        --result_cache_force or any option that updates the profile (e.g., --record).
+        """
+        self.result_cache_hit = False
+        self.result_cache_key = None
+        if pytestconfig is None or not getattr(pytestconfig.option, 'result_cache', False):
+            return
+
+        profile_name = config_model.test_case_profile_filename_rel
+        option = pytestconfig.option
+        if any(
+            getattr(option, o, False)
+            for o in ['merge_inputs', 'record', 'replace_exit_message', 'replace_outputs']
+        ):
+            self.result_cache.delete(profile_name)
+            return
+
+        key = self.result_cache.key(
+            config_model.test_case_profile_filename,
+            option.environment or config_model.os_environments,
+        )
+        if not getattr(option, 'result_cache_force', False) and self.result_cache.hit(
+            profile_name, key
+        ):
+            self.log.info(f'step=run, event=result-cache-hit, profile={profile_name}')
+            # prevent the teardown from updating the profile
+            self.skip = True
+            self.result_cache_hit = True
+            return
+
+        # remove the previous result, it is only recorded again if the profile passes
+        self.result_cache.delete(profile_name)
+        self.result_cache_key = key
+
+    def result_cache_record(self):
+        """Record that the current profile passed with the current inputs."""
+        if self.result_cache_key is not None:
+            self.result_cache.record(
+                config_model.test_case_profile_filename_rel, self.result_cache_key
+            )
+
     def stage_and_replace(self, stage_key, data, stage_function, fail_on_error=True):
         """Stage and replace data."""
         staged_data = stage_function(data) if data is not None else stage_function()
         self.staged_data.update({stage_key: staged_data})
         self.replace_variables(fail_on_error=fail_on_error)
 
+    @phase_timer.timed('stage')
     def stage_data(self):
         """Stage data for current profile."""
+        stage = self._profile_runner.data.get('stage', {})
 
-        self.stage_and_replace('env', None, self.stager.env.stage_model_data, fail_on_error=False)
-        request_data = self._profile_runner.data.get('stage', {}).get('request', {})
-        if self._profile_runner.pytest_args_model.record:
-            self.stager.request.record_all(self.recorded_data)
-        else:
-            self.stager.request.stage(request_data)
-        vault_data = self._profile_runner.data.get('stage', {}).get('vault', {})
-        self.stage_and_replace('vault', vault_data, self.stager.vault.stage, fail_on_error=False)
-        tc_data = self._profile_runner.data.get('stage', {}).get('threatconnect', {})
-        self.stage_and_replace('tc', tc_data, self.stager.threatconnect.stage, fail_on_error=True)
-        self.stager.redis.from_dict(self._profile_runner.model_resolved.stage.kvstore)
+        with phase_timer.phase('stage.env'):
+            self.stage_and_replace(
+                'env', None, self.stager.env.stage_model_data, fail_on_error=False
+            )
+        with phase_timer.phase('stage.request'):
+            request_data = stage.get('request', {})
+            if self._profile_runner.pytest_args_model.record:
+                self.stager.request.record_all(self.recorded_data)
+            else:
+                self.stager.request.stage(request_data)
+        with phase_timer.phase('stage.vault'):
+            vault_data = stage.get('vault', {})
+            self.stage_and_replace(
+                'vault', vault_data, self.stager.vault.stage, fail_on_error=False
+            )
+        with phase_timer.phase('stage.threatconnect'):
+            tc_data = stage.get('threatconnect', {})
+            self.stager.threatconnect.concurrent = self.tc_concurrent
+            self.stage_and_replace(
+                'tc', tc_data, self.stager.threatconnect.stage, fail_on_error=True
+            )
+        with phase_timer.phase('stage.kvstore'):
+            self.stager.redis.from_dict(self._profile_runner.model_resolved.stage.kvstore)
 
     def log_staged_data(self):
         """Log staged data."""
@@ -303,24 +442,19 @@ class Aux:
         if prefixes is None:
             prefixes = ['env', 'tc', 'vault']
 
-        profile_dict = self._profile_runner.model.dict()
-        outputs_section = profile_dict.pop('outputs', {})
-        profile = json.dumps(profile_dict)
-
-        for m in re.finditer(r'\${(.*?)}', profile):
-            full_match = str(m)
+        def resolve(variable: Variable) -> str | None:
+            """Return the staged data value for the variable or None to leave it unchanged."""
+            full_match = variable.text
             try:
-                full_match = m.group(0)
-                jmespath_expression = m.group(1)
-                jmespath_expression = jmespath_expression.encode().decode('unicode_escape')
+                jmespath_expression = variable.groups[0]
 
                 if not any(jmespath_expression.startswith(f'{prefix}.') for prefix in prefixes):
-                    continue
+                    return None
 
-                value = jmespath.search(jmespath_expression, self.staged_data)
+                value = compile_expression(jmespath_expression).search(self.staged_data)
 
                 if not value and not fail_on_error:
-                    continue
+                    return None
 
                 if not value:
                     self.log_staged_data()
@@ -330,7 +464,7 @@ class Aux:
                     )
                     Render.panel.failure(f'Jmespath for {full_match} was invalid value: {value}.')
 
-                profile = profile.replace(full_match, str(value))
+                return str(value)
             except Exception:
                 self.log_staged_data()
                 if fail_on_error:
@@ -340,10 +474,27 @@ class Aux:
                     self.log.warning(
                         f'step=run, event=replace-variables-non-fatal, error={full_match}'
                     )
-        profile_dict = json.loads(profile)
+            return None
+
+        template, outputs_section = self.variable_template
+        profile_dict = template.render(resolve)
         profile_dict['outputs'] = outputs_section
         self._profile_runner.data = profile_dict
 
+    @property
+    def variable_template(self) -> tuple[VariableTemplate, dict]:
+        """Return the compiled variable template and the outputs section of the current profile.
+
+        The profile is tokenized once and rendered after each staging step. The outputs
+        section does not contain variables and is not part of the template.
+        """
+        model = self._profile_runner.model
+        if self._variable_template is None or self._variable_template[0] is not model:
+            profile_dict = model.dict()
+            outputs_section = profile_dict.pop('outputs', {})
+            self._variable_template = (model, VariableTemplate(profile_dict), outputs_section)
+        return self._variable_template[1], self._variable_template[2]
+
     @cached_property
     def module_app_model(self) -> ModuleAppModel:
         """Return the Module App Model."""
@@ -378,8 +529,16 @@ class Aux:
             proxy_pass=config_model.tc_proxy_password,
         )
 
+    @phase_timer.timed('cleanup')
     def cleanup(self):
-        """Cleanup staged data."""
+        """Cleanup staged data.
+
+        With --defer_cleanup the ThreatConnect data is left in the cleanup journal, which
+        is drained at the end of the test session.
+        """
+        if self.defer_cleanup:
+            self.log.info('step=cleanup, event=cleanup-deferred')
+            return
         self.stager.threatconnect.cleanup(self.staged_data.get('tc', {}))
 
     @cached_property
@@ -430,29 +589,76 @@ class Aux:
         return Stager(self.playbook, self.app.key_value_store.redis_client, self.session_tc)
 
     @property
-    def tc_token(self):
-        """Return a valid API token."""
+    def tc_token(self) -> str | None:
+        """Return a valid API token.
+
+        The token is cached encrypted on disk so that it is shared by all tests and xdist workers
+        in the session. A new token is retrieved when the cached token is about to expire.
+        """
+        data = self._tc_token_data
+        return None if data is None else data['token']
+
+    @property
+    def tc_token_expires(self) -> int:
+        """Return the expiration (epoch seconds) of the cached API token."""
+        data = self._tc_token_data or {}
+        return int(data.get('expires') or time.time() + config_model.test_token_ttl)
+
+    @property
+    def _tc_token_data(self) -> dict | None:
+        """Return the cached (or a new) API token and its expiration."""
         if config_model.tc_api_path is None:  # no API path, no token
             return None
 
+        # hold the lock while retrieving so concurrent workers only fetch a single token
+        with self.token_cache.cache.lock:
+            data = self.token_cache.get_token(refresh=self.tc_token_refresh)
+            if data is None:
+                token, expires = self._tc_token_retrieve()
+                if token is not None:
+                    data = {'expires': expires, 'token': token}
+                    self.token_cache.set_token(token, expires)
+        return data
+
+    @property
+    def tc_token_refresh(self) -> int:
+        """Return the number of seconds before expiration that a token is refreshed."""
+        return min(300, config_model.test_token_ttl // 4)
+
+    def _tc_token_retrieve(self) -> tuple[str | None, int]:
+        """Return a new API token and its expiration from the ThreatConnect API."""
         data = None
         http_success = 200
         token = None
+        expires = int(time.time()) + config_model.test_token_ttl
         # defaulting to api token
         token_type = 'api'  # nosec
 
         # retrieve token from API using HMAC auth
         r = self.session_exchange.post(f'/internal/token/{token_type}', json=data, verify=True)
         if r.status_code == http_success:
-            token = r.json().get('data')
+            response_json = r.json()
+            token = response_json.get('data')
+
+            # use the expiration provided by the server (epoch seconds or milliseconds)
+            expires_server = response_json.get('apiTokenExpires') or response_json.get('expires')
+            if expires_server:
+                expires_server = int(expires_server)
+                expires = expires_server // 1000 if expires_server > 10**11 else expires_server
             self.log.info(
                 f'step=setup, event=using-token, '
                 f'token=***{token[-4:] if token else ""}, token-elapsed={r.elapsed}'
             )
         else:
             self.log.error(f'step=setup, event=failed-to-retrieve-token error="{r.text}"')
-        return token
+        return token, expires
+
+    @cached_property
+    def token_cache(self) -> TokenCache:
+        """Return the encrypted API token cache."""
+        return TokenCache()
 
+    @phase_timer.timed('validate_exit_message')
     def validate_exit_message(self, exit_message_data: ExitMessageModel):
         """Validate App exit message."""
         # convert model to dict
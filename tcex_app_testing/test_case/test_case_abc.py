@@ -12,6 +12,7 @@ import urllib3
 
 # first-party
 from tcex_app_testing.config_model import config_model
+from tcex_app_testing.metrics import phase_timer
 from tcex_app_testing.test_case.aux_ import Aux
 
 # disable ssl warning message
@@ -115,19 +116,23 @@ class TestCaseABC(ABC):  # noqa: B024
     def teardown_method(self):
         """Run after each test method runs."""
         if self.aux.skip is False:
-            if self.enable_update_profile:
-                self.aux.profile_runner.update.exit_message()
-                self.aux.profile_runner.update.request(self.aux.recorded_data)
+            with phase_timer.phase('teardown_update'):
+                if self.enable_update_profile:
+                    self.aux.profile_runner.update.exit_message()
+                    self.aux.profile_runner.update.request(self.aux.recorded_data)
 
-            # the "initialized" property is used to determine if the profile was run previously
-            # and the exit message and outputs have been updated. if the profile is not
-            # initialized, then validations are skipped and the test will intentionally fail.
-            # on future runs of the test profile the validations will run.
-            self.aux.profile_runner.update.initialized()
+                # the "initialized" property is used to determine if the profile was run
+                # previously and the exit message and outputs have been updated. if the profile
+                # is not initialized, then validations are skipped and the test will
+                # intentionally fail. on future runs of the test profile the validations will run.
+                self.aux.profile_runner.update.initialized()
 
             self.log.info(
                 f'step=teardown-method, event=finished, datetime={datetime.now(UTC).isoformat()}'
             )
 
+        # write the phase timings for the profile (log/timings.jsonl)
+        phase_timer.write()
+
         # clear cache for playbook, stager, validator property
         self.aux.clear_cache()
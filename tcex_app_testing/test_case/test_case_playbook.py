@@ -1,18 +1,41 @@
 """TcEx Framework Module"""
 
 # standard library
+import importlib
+import logging
 import os
 import subprocess  # nosec
 import sys
 from typing import cast
 
+# first-party
+from tcex_app_testing.metrics import phase_timer
+from tcex_app_testing.validator.kvstore_snapshot import kvstore_snapshot
+
+from .app_worker_pool import AppWorkerPool
 from .test_case_playbook_common import TestCasePlaybookCommon
 
 
 class TestCasePlaybook(TestCasePlaybookCommon):
     """Playbook TestCase Class"""
 
-    run_method = 'inline'  # run service inline or a as subprocess
+    run_method = 'inline'  # run service inline, in a forked process, a worker pool, or a subprocess
+
+    # worker settings for the "pool" run method (max_rss is in MB)
+    pool_max_rss = 1024
+    pool_max_runs = 25
+
+    # the worker pool is shared by all test cases in the session
+    _app_worker_pool: AppWorkerPool | None = None
+
+    @classmethod
+    def _app_worker_pool_start(cls) -> AppWorkerPool:
+        """Return the worker pool, starting it if it is not running."""
+        if TestCasePlaybook._app_worker_pool is None:
+            TestCasePlaybook._app_worker_pool = AppWorkerPool(
+                max_runs=cls.pool_max_runs, max_rss=cls.pool_max_rss
+            )
+        return TestCasePlaybook._app_worker_pool
 
     def run(self) -> int:
         """Run the Playbook App."""
@@ -37,10 +60,65 @@ class TestCasePlaybook(TestCasePlaybookCommon):
         self.log.info(f'step=run, event=app-exit, exit-code={exit_code}')
         return exit_code
 
+    def run_fork(self) -> int:
+        """Run the Playbook App in a forked child process.
+
+        The run module (and with it tcex and the App dependencies) is imported once in the
+        parent process. Each profile then runs in a fresh fork of that pre-warmed parent,
+        which isolates global state (tcex registry, cached properties, etc) like a subprocess
+        without paying the interpreter startup and import cost for every profile.
+        """
+        if not hasattr(os, 'fork'):
+            ex_msg = 'The fork run_method is not supported on this platform.'
+            raise RuntimeError(ex_msg)
+
+        # pre-warm the parent process, so that the import is inherited by every child
+        importlib.import_module('run')
+
+        pid = os.fork()
+        if pid == 0:
+            # child process: run the App and exit without returning control to pytest
+            exit_code = 1
+            try:
+                sys.argv = sys.argv[:1]
+                code = self.run()
+                # e.code is None for sys.exit() and a str for sys.exit('message')
+                exit_code = code if isinstance(code, int) else int(code is not None)
+            except BaseException:
+                self.log.exception('step=run, event=fork-child-encountered-exception')
+            finally:
+                try:
+                    sys.stdout.flush()
+                    sys.stderr.flush()
+                    logging.shutdown()
+                finally:
+                    # the child must never return to pytest, whatever happened above
+                    os._exit(exit_code)
+
+        # parent process: the exit code of the child is the exit code of the App
+        _, status = os.waitpid(pid, 0)
+        return os.waitstatus_to_exitcode(status)
+
+    def run_pool(self) -> int:
+        """Run the Playbook App in a pre-spawned worker process.
+
+        The worker is a persistent App interpreter that runs one profile at a time and is
+        recycled after pool_max_runs profiles or once its peak RSS reaches pool_max_rss.
+        """
+        # the worker gets the current environment (e.g., the encrypted config file, profile
+        # env and changes made in setup_method) the same way a subprocess would
+        return self._app_worker_pool_start().run(dict(os.environ))
+
+    @phase_timer.timed('run_profile')
     def run_profile(self) -> int:
         """Run an App using the profile name."""
-        # create encrypted config file
-        self.aux.create_config(self.aux.profile_runner.inputs)
+        # inline Apps get the config in memory, all others get an encrypted config file. the
+        # file is also written for inline Apps until tcex is confirmed to use the inline config
+        inline = self.run_method == 'inline' and self.aux.create_config_inline(
+            self.aux.profile_runner.inputs
+        )
+        if not inline or not self.aux.inline_config_applied:
+            self.aux.create_config(self.aux.profile_runner.inputs)
 
         if os.getenv('TC_PLAYBOOK_WRITE_NULL') is not None:
             del os.environ['TC_PLAYBOOK_WRITE_NULL']
@@ -48,9 +126,13 @@ class TestCasePlaybook(TestCasePlaybookCommon):
         if 0 in self.aux.profile_runner.model.exit_codes:
             os.environ['TC_PLAYBOOK_WRITE_NULL'] = 'true'
 
-        # run the service App in 1 of 3 ways
+        # run the App in 1 of 4 ways
         exit_code = 1
-        if self.run_method == 'inline':
+        if self.run_method == 'fork':
+            exit_code = self.run_fork()
+        elif self.run_method == 'pool':
+            exit_code = self.run_pool()
+        elif self.run_method == 'inline':
             # backup sys.argv
             sys_argv_orig = sys.argv
 
@@ -71,12 +153,34 @@ class TestCasePlaybook(TestCasePlaybookCommon):
         os.environ.pop('TC_APP_PARAM_KEY', None)
         os.environ.pop('TC_APP_PARAM_FILE', None)
 
+        # the App wrote new outputs, any snapshot of the context is stale
+        kvstore_snapshot.clear(self.aux.tc_playbook_kvstore_context)
+
         # add context for populating output variables
         self.aux.profile_runner.add_context(self.aux.tc_playbook_kvstore_context)
 
         return exit_code
 
+    @classmethod
+    def setup_class(cls):
+        """Run once before all test cases."""
+        super().setup_class()
+
+        # start the worker before the first profile, so it imports the App while it is staged
+        if cls.run_method == 'pool':
+            cls._app_worker_pool_start()
+
     def setup_method(self):
         """Run before each test method runs."""
         super().setup_method()
-        self.aux.stager.redis.from_dict(self.redis_staging_data)
+
+        # the data that is identical for every test is cloned from a template hash
+        self.aux.stager.redis.from_template(
+            self.aux.tc_playbook_kvstore_context,
+            {
+                k: v
+                for k, v in self.redis_staging_data.items()
+                if k not in self.redis_unique_staged_data
+            },
+            self.redis_unique_staged_data,
+        )
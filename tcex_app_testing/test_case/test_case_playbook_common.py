@@ -5,6 +5,10 @@ import time
 import uuid
 from typing import ClassVar
 
+# first-party
+from tcex_app_testing.metrics import phase_timer
+from tcex_app_testing.validator.kvstore_snapshot import kvstore_snapshot
+
 from .test_case_abc import TestCaseABC
 
 
@@ -34,6 +38,9 @@ class TestCasePlaybookCommon(TestCaseABC):
         # '#App:1234:null!TCEntityArray': None,
     }
 
+    # the staging data that is regenerated for each test method (e.g., epoch and uuid)
+    redis_unique_staged_data: dict[str, str]
+
     @property
     def app_inputs(self):
         """Return App inputs."""
@@ -54,11 +61,11 @@ class TestCasePlaybookCommon(TestCaseABC):
         """Run before each test method runs."""
         super().setup_method()
         # APP-78 - The unique redis data that will be regenerated each test method.
-        redis_unique_staged_data = {
+        self.redis_unique_staged_data = {
             '#App:1234:epoch!String': str(int(time.time())),
             '#App:1234:uuid!String': str(uuid.uuid4()),
         }
-        self.redis_staging_data.update(redis_unique_staged_data)
+        self.redis_staging_data.update(self.redis_unique_staged_data)
 
     def run(self):
         """Implement in Child Class"""
@@ -76,14 +83,19 @@ class TestCasePlaybookCommon(TestCaseABC):
         if self.enable_update_profile and self.aux.skip is False:
             self.log.info('Update Outputs')
 
-            # validate outputs first
-            self.aux.profile_runner.validate()
+            with phase_timer.phase('teardown_outputs'):
+                # validate outputs first
+                self.aux.profile_runner.validate()
+
+                # update outputs if required
+                self.aux.profile_runner.update.outputs()
 
-            # update outputs if required
-            self.aux.profile_runner.update.outputs()
+        # clear context tracker (the profile runner is not created for cached results)
+        if self.aux.result_cache_hit is False:
+            self.aux.profile_runner._context_tracker = []  # noqa: SLF001
 
-        # clear context tracker
-        self.aux.profile_runner._context_tracker = []  # noqa: SLF001
+        # the output snapshots are only valid for the current test
+        kvstore_snapshot.clear()
 
         # run test_case teardown_method
         super().teardown_method()
@@ -0,0 +1,100 @@
+"""TcEx Framework Module"""
+
+# standard library
+import json
+import logging
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+
+# third-party
+from redis import Redis
+
+# get logger
+_logger = logging.getLogger(__name__.split('.', maxsplit=1)[0])
+
+
+class KvstoreSnapshot:
+    """Snapshot of the kv store context data written by the App during a test.
+
+    Each context is read once with HGETALL, the first time any of its variables is accessed,
+    and the variables are only de-serialized when they are requested. The snapshot is shared
+    by the output validation (ValidatorKvstore) and the profile validation and update in the
+    teardown of the test, and must be cleared when the App writes to the context again.
+    """
+
+    def __init__(self):
+        """Initialize instance properties."""
+        self.log = _logger
+
+        # properties
+        self._data: dict[str, dict[bytes, bytes]] = {}
+        self._decoded: dict[tuple[str, bytes], Any] = {}
+
+    @staticmethod
+    def _bytes(value: bytes | str) -> bytes:
+        """Return the value as bytes."""
+        return value.encode('utf-8') if isinstance(value, str) else value
+
+    @staticmethod
+    def _str(value: bytes | str) -> str:
+        """Return the value as str."""
+        return value.decode('utf-8') if isinstance(value, bytes) else value
+
+    def clear(self, context: str | None = None):
+        """Clear the snapshot of the context, or of all contexts."""
+        if context is None:
+            self._data.clear()
+            self._decoded.clear()
+            return
+
+        self._data.pop(context, None)
+        self._decoded = {k: v for k, v in self._decoded.items() if k[0] != context}
+
+    def data(self, redis_client: Redis, context: bytes | str) -> dict[bytes, bytes]:
+        """Return the raw (serialized) data of the context."""
+        context = self._str(context)
+        data = self._data.get(context)
+        if data is None:
+            data = {
+                self._bytes(k): self._bytes(v)
+                for k, v in redis_client.hgetall(context).items()  # type: ignore
+            }
+            self._data[context] = data
+            self.log.debug(
+                f'step=validate, event=kvstore-snapshot, context={context}, keys={len(data)}'
+            )
+        return data
+
+    def keys(self, redis_client: Redis, context: str) -> list[str]:
+        """Return the variables written to the context."""
+        return [k.decode('utf-8') for k in self.data(redis_client, context)]
+
+    @contextmanager
+    def serve(self, redis_client: Redis) -> Iterator[None]:
+        """Serve the HGET calls made to the redis client (e.g., by Playbook.read) from snapshots."""
+
+        def _hget(name, key):
+            return self.data(redis_client, name).get(self._bytes(key))
+
+        redis_client.hget = _hget  # type: ignore
+        try:
+            yield
+        finally:
+            # remove the instance attribute to restore the Redis.hget method
+            del redis_client.hget
+
+    def value(self, redis_client: Redis, context: str, variable: str) -> Any:
+        """Return the de-serialized value of the variable or None if it was not written."""
+        key = (context, self._bytes(variable))
+        if key not in self._decoded:
+            data = self.data(redis_client, context).get(key[1])
+            if data is not None:
+                # redis return bytes, convert to str and de-serialize
+                data = json.loads(data.decode('utf-8'))
+            self._decoded[key] = data
+        return self._decoded[key]
+
+
+# shared by the validator and profile instances of the current test
+kvstore_snapshot = KvstoreSnapshot()
@@ -3,6 +3,9 @@
 # standard library
 from typing import TYPE_CHECKING, Any
 
+# first-party
+from tcex_app_testing.validator.kvstore_snapshot import kvstore_snapshot
+
 if TYPE_CHECKING:
     # first-party
     from tcex_app_testing.validator import Validator  # CIRCULAR-IMPORT
@@ -21,12 +24,14 @@ class ValidatorKvstore:
         self.log = self.validator.log
 
     def _read_variable(self, variable: str) -> Any:
-        if variable.endswith('Binary'):
-            app_data = self.playbook.read.binary(variable, b64decode=False, decode=False)
-        elif variable.endswith('BinaryArray'):
-            app_data = self.playbook.read.binary_array(variable, b64decode=False, decode=False)
-        else:
-            app_data = self.playbook.read.variable(variable)
+        # the data is read from the snapshot of the context instead of one HGET per output
+        with kvstore_snapshot.serve(self.redis_client):
+            if variable.endswith('Binary'):
+                app_data = self.playbook.read.binary(variable, b64decode=False, decode=False)
+            elif variable.endswith('BinaryArray'):
+                app_data = self.playbook.read.binary_array(variable, b64decode=False, decode=False)
+            else:
+                app_data = self.playbook.read.variable(variable)
         return app_data
 
     def data(
@@ -76,7 +81,8 @@ class ValidatorKvstore:
             self.log.error('step=validate, event=kvstore-variable-not-provided')
             return False
 
-        variable_data = self.playbook.read.variable(variable)
+        with kvstore_snapshot.serve(self.redis_client):
+            variable_data = self.playbook.read.variable(variable)
         self.log.info(
             f'step=validate, event=not-null, variable={variable}, db-data={variable_data}'
         )
@@ -91,7 +97,8 @@ class ValidatorKvstore:
 
     def type(self, variable: str) -> bool:
         """Validate the type of a redis variable"""
-        variable_data = self.playbook.read.variable(variable)
+        with kvstore_snapshot.serve(self.redis_client):
+            variable_data = self.playbook.read.variable(variable)
         self.log.info(
             f'step=validate, event=validate-type, variable={variable}, db-data={variable_data}'
         )
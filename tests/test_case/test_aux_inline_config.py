@@ -0,0 +1,68 @@
+"""TcEx Framework Module"""
+
+# standard library
+import sys
+import types
+from pathlib import Path
+
+# third-party
+from _pytest.monkeypatch import MonkeyPatch
+
+# first-party
+from tcex_app_testing.test_case.aux_ import Aux
+
+
+class Input:
+    """Stand-in for the tcex Input class that records the config it was built with."""
+
+    def __init__(self, config: dict | None = None, config_file: str | None = None):
+        """Initialize instance properties."""
+        self.config = config
+        self.config_file = config_file
+
+
+class TestAuxInlineConfig:
+    """Test the inline config of Apps that run in the test process."""
+
+    @staticmethod
+    def _aux(monkeypatch: MonkeyPatch, tmp_path: Path) -> Aux:
+        """Return an Aux instance with the profile inputs resolved to a fixed config."""
+        input_module = types.ModuleType('tcex.input.input')
+        input_module.Input = Input  # type: ignore
+        for name in ['tcex', 'tcex.input']:
+            monkeypatch.setitem(sys.modules, name, sys.modules.get(name, types.ModuleType(name)))
+        monkeypatch.setitem(sys.modules, 'tcex.input.input', input_module)
+        monkeypatch.setattr(Aux, 'inline_config_applied', False)
+
+        aux = Aux.__new__(Aux)
+        aux.log = types.SimpleNamespace(info=lambda *_: None)  # type: ignore
+        aux._profile_runner = types.SimpleNamespace(monkeypatch=monkeypatch)  # type: ignore # noqa: SLF001
+        aux._log_inputs = lambda *_: None  # type: ignore # noqa: SLF001
+        aux.create_config_update = lambda inputs: {  # type: ignore
+            **inputs,
+            'tc_in_path': str(tmp_path / 'in'),
+        }
+        return aux
+
+    def test_inline_profile_input(self, monkeypatch: MonkeyPatch, tmp_path: Path):
+        """The App sees the profile inputs when tcex builds Input with an empty config."""
+        aux = self._aux(monkeypatch, tmp_path)
+
+        assert aux.create_config_inline({'my_input': 'profile value'}) is True
+        assert Aux.inline_config_applied is False
+
+        # tcex always passes a dict (e.g., Input(kwargs.get('config') or {}, config_file))
+        app_input = sys.modules['tcex.input.input'].Input({}, None)
+
+        assert app_input.config['my_input'] == 'profile value'
+        assert app_input.config['tc_in_path'] == str(tmp_path / 'in')
+        assert Aux.inline_config_applied is True
+
+    def test_inline_config_override(self, monkeypatch: MonkeyPatch, tmp_path: Path):
+        """Config passed to Input explicitly takes precedence over the profile inputs."""
+        aux = self._aux(monkeypatch, tmp_path)
+        aux.create_config_inline({'my_input': 'profile value'})
+
+        app_input = sys.modules['tcex.input.input'].Input({'my_input': 'explicit'}, None)
+
+        assert app_input.config['my_input'] == 'explicit'